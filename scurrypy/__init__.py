@@ -1,10 +1,12 @@
 # scurrypy
 
 from .client import Client
+from .cluster import Cluster
 
 __all__ = [
     # top-level modules
-    "Client"
+    "Client",
+    "Cluster"
 ]
 
 # imports listed  __all__ libs
@@ -3,8 +3,14 @@ import inspect
 
 from .core.intents import Intents
 from .core.http import HTTPClient
-from .core.gateway import GatewayClient
+from .core.gateway import GatewayClient, RESUMABLE_CLOSE_CODE
 from .core.error import DiscordError
+from .core.dispatch import DispatchModes, OrderingKeys, ShardDispatcher
+from .core.event_queue import EventQueue, OverflowPolicies
+from .core.codec import JSONCodec, get_codec
+from .core.identify import IdentifyScheduler
+from .core.session_store import SessionStore
+from .core.cache import EntityCache
 
 from .events.gateway_events import GatewayEvent
 
@@ -23,6 +29,51 @@ class Client:
     intents: int
     """Bot intents for listening to events."""
 
+    lazy_events: bool
+    """Whether nested event fields are hydrated on first read."""
+
+    dispatch_mode: str
+    """How event handlers are run. See [`DispatchModes`][scurrypy.core.dispatch.DispatchModes]."""
+
+    max_concurrent_handlers: int
+    """Max events whose handlers run at once per shard (concurrent mode only)."""
+
+    ordering_key: callable
+    """Maps `(dispatch_type, event_data)` to a key; events sharing a key stay ordered (concurrent mode only)."""
+
+    max_queue_size: int
+    """Max queued events per shard. `0` means unbounded."""
+
+    overflow_policy: str
+    """What a full shard queue does. See [`OverflowPolicies`][scurrypy.core.event_queue.OverflowPolicies]."""
+
+    overflow_types: set[str]
+    """Event names the overflow policy may drop or coalesce. `None` means any event."""
+
+    compress: bool
+    """Whether shards use `zlib-stream` transport compression."""
+
+    codec: JSONCodec
+    """JSON codec shared by the gateway and HTTP clients."""
+
+    encoding: str
+    """Gateway payload encoding, `json` or `etf`."""
+
+    shard_ids: list[int]
+    """Shards this client runs. `None` means every shard."""
+
+    total_shards: int
+    """Shard count across all hosts. `None` means Discord's recommendation."""
+
+    session_store: SessionStore
+    """Where shard sessions are saved on shutdown and resumed from on startup. `None` disables it."""
+
+    global_rate_limit: int
+    """Max HTTP requests per second across all routes, except interaction callbacks."""
+
+    cache: EntityCache
+    """Entities kept current from gateway events for `get_*` lookups. `None` disables it."""
+
     _http: HTTPClient
     """HTTP session for requests."""
 
@@ -32,6 +83,9 @@ class Client:
     events: dict[str: list[callable]]
     """Events for the client to listen to."""
 
+    dropped_events: dict[str, int]
+    """Count of dispatches per event name dropped without hydration because no listener was registered."""
+
     startup_hooks: list[callable]
     """Handlers to call once before the bot starts."""
 
@@ -41,24 +95,115 @@ class Client:
     def __init__(self, 
         *,
         token: str,
-        intents: int = Intents.DEFAULT
+        intents: int = Intents.DEFAULT,
+        lazy_events: bool = False,
+        dispatch_mode: str = DispatchModes.SEQUENTIAL,
+        max_concurrent_handlers: int = 100,
+        ordering_key = OrderingKeys.channel,
+        max_queue_size: int = 0,
+        overflow_policy: str = OverflowPolicies.BLOCK,
+        overflow_types: set[str] = None,
+        compress: bool = False,
+        json_codec: str = 'json',
+        encoding: str = 'json',
+        shard_ids: list[int] = None,
+        total_shards: int = None,
+        session_store: SessionStore = None,
+        global_rate_limit: int = 50,
+        cache: EntityCache = None
     ):
         """
         Args:
             token (str): the bot's token
             intents (int, optional): gateway intents. Defaults to `Intents.DEFAULT`.
+            lazy_events (bool, optional): hydrate nested event fields (models, lists) from `event.raw` 
+                only when a handler first reads them. Events are then instances of a subclass: use `isinstance`,
+                not `type(event) is ...`. They compare equal to eager events and pickle as the plain event class.
+                Defaults to False.
+            dispatch_mode (str, optional): how event handlers are run. 
+                See [`DispatchModes`][scurrypy.core.dispatch.DispatchModes]. Defaults to `DispatchModes.SEQUENTIAL`.
+            max_concurrent_handlers (int, optional): max events whose handlers run at once per shard 
+                in concurrent mode. Defaults to 100.
+            ordering_key (callable, optional): maps `(dispatch_type, event_data)` to a key in concurrent mode.
+                Events sharing a key run in order; `None` runs freely. 
+                See [`OrderingKeys`][scurrypy.core.dispatch.OrderingKeys]. Defaults to `OrderingKeys.channel`.
+            max_queue_size (int, optional): max queued events per shard. `0` means unbounded. Defaults to 0.
+            overflow_policy (str, optional): what a full shard queue does with the next event.
+                See [`OverflowPolicies`][scurrypy.core.event_queue.OverflowPolicies]. Defaults to `OverflowPolicies.BLOCK`.
+            overflow_types (set[str], optional): event names the overflow policy may drop or coalesce.
+                `None` means any event. Defaults to None.
+            compress (bool, optional): use `zlib-stream` transport compression on every shard. Defaults to False.
+            json_codec (str, optional): JSON codec for the gateway and HTTP: `json`, `orjson`, `msgspec`, 
+                or `auto` for the fastest installed. Defaults to `json`.
+            encoding (str, optional): gateway payload encoding. `etf` gives smaller frames 
+                and snowflakes as ints, but its pure-Python decoder is roughly 8-10x slower than `json` 
+                on large dispatches like GUILD_CREATE. Prefer it only when bandwidth, not CPU, is the limit. Defaults to `json`.
+            shard_ids (list[int], optional): subset of shards to run on this host. Defaults to every shard.
+            total_shards (int, optional): shard count across all hosts. Required to split shards across hosts
+                consistently. Defaults to Discord's recommended count.
+            session_store (SessionStore, optional): saves each shard's session on shutdown so the next boot 
+                can RESUME instead of IDENTIFY. See [`FileSessionStore`][scurrypy.core.session_store.FileSessionStore]. 
+                Defaults to None.
+            global_rate_limit (int, optional): max HTTP requests per second across all routes, paced before 
+                Discord's global limit trips. Interaction callbacks are exempt. Defaults to 50.
+            cache (EntityCache, optional): keeps guilds, channels, roles, members, and users current from 
+                gateway events so resources' `get_*` methods skip the REST call. 
+                See [`EntityCache`][scurrypy.core.cache.EntityCache]. Defaults to None.
         """
         if not isinstance(intents, int):
             raise ValueError("Intents must be an integer.")
         
+        if dispatch_mode not in (DispatchModes.SEQUENTIAL, DispatchModes.CONCURRENT):
+            raise ValueError(f"Invalid dispatch mode: {dispatch_mode}")
+        
+        if max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1.")
+        
+        if encoding not in ('json', 'etf'):
+            raise ValueError(f"Invalid gateway encoding: {encoding}")
+        
+        if overflow_policy not in (OverflowPolicies.BLOCK, OverflowPolicies.DROP_OLDEST, OverflowPolicies.COALESCE):
+            raise ValueError(f"Invalid overflow policy: {overflow_policy}")
+        
+        if global_rate_limit < 1:
+            raise ValueError("global_rate_limit must be at least 1.")
+        
+        if total_shards is not None and total_shards < 1:
+            raise ValueError("total_shards must be at least 1.")
+        
+        if shard_ids is not None:
+            shard_ids = sorted(set(shard_ids))
+
+            if not shard_ids:
+                raise ValueError("shard_ids must not be empty.")
+
+            if total_shards is not None and not all(0 <= i < total_shards for i in shard_ids):
+                raise ValueError(f"shard_ids must be within 0-{total_shards - 1}.")
+        
         self.token = token
         self.intents = intents
+        self.lazy_events = lazy_events
+        self.dispatch_mode = dispatch_mode
+        self.max_concurrent_handlers = max_concurrent_handlers
+        self.ordering_key = ordering_key
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.overflow_types = overflow_types
+        self.compress = compress
+        self.codec = get_codec(json_codec)
+        self.encoding = encoding
+        self.shard_ids = shard_ids
+        self.total_shards = total_shards
+        self.session_store = session_store
+        self.global_rate_limit = global_rate_limit
+        self.cache = cache
         
-        self._http = HTTPClient()
+        self._http = HTTPClient(self.codec, global_rate_limit)
 
         self.shards: list[GatewayClient] = []
 
         self.events = {}
+        self.dropped_events = {}
         self.startup_hooks = []
         self.shutdown_hooks = []
 
@@ -161,7 +306,7 @@ class Client:
         """
         from .resources.guild import Guild
 
-        return Guild(self._http, context, guild_id)
+        return Guild(self._http, context, guild_id, _cache=self.cache)
 
     def channel(self, channel_id: int, *, context = None):
         """Creates an interactable channel resource.
@@ -175,7 +320,7 @@ class Client:
         """
         from .resources.channel import Channel\
 
-        return Channel(self._http, context, channel_id)
+        return Channel(self._http, context, channel_id, _cache=self.cache)
     
     def command(self, application_id: int, guild_id: int = None, command_id: int = None, *, context = None):
         """Creates an interactable command resource.
@@ -235,7 +380,94 @@ class Client:
         """
         from .resources.user import User
 
-        return User(self._http, context, user_id)
+        return User(self._http, context, user_id, _cache=self.cache)
+
+    def _make_event_queue(self):
+        """Build a shard's event queue from the client's queue settings.
+
+        Returns:
+            (EventQueue): the shard's queue
+        """
+        return EventQueue(self.max_queue_size, self.overflow_policy, self.overflow_types)
+
+    def queue_metrics(self):
+        """Snapshot of every shard's event queue metrics.
+
+        Returns:
+            (dict[int, dict]): shard ID -> depth, high-water mark, and overflow counters
+        """
+        return {shard.shard_id: shard.event_queue.metrics() for shard in self.shards}
+
+    def http_metrics(self):
+        """Snapshot of the HTTP client's metrics.
+
+        Returns:
+            (dict): retries by cause (`rate_limit`, `server_error`, `connection`), requests that ran out of retries,
+                interaction callbacks answered past the 3s deadline, and GETs answered by an identical request in flight
+        """
+        return self._http.metrics()
+
+    def request_guild_members(self, 
+        guild_ids: list[int], 
+        *, 
+        query: str = '', 
+        limit: int = 0, 
+        user_ids: list[int] = None, 
+        presences: bool = False,
+        timeout: float = 30
+    ):
+        """Request members of many guilds over the gateway instead of paging REST.
+            Each guild is queued on the shard it lives on; shards send their queues concurrently.
+
+        !!! note
+            Listing every member (empty `query`, `limit` 0) needs the `GUILD_MEMBERS` intent.
+
+        Args:
+            guild_ids (list[int]): IDs of the guilds
+            query (str, optional): only members whose username starts with this. Defaults to '' (all).
+            limit (int, optional): max members per guild. `0` means no limit. Defaults to 0.
+            user_ids (list[int], optional): fetch these users instead of matching `query`. Defaults to None.
+            presences (bool, optional): include members' presences. Defaults to False.
+            timeout (float, optional): seconds to wait for each chunk, counted from when a request is sent, 
+                before it fails with `asyncio.TimeoutError`. Queued requests don't time out. Defaults to 30.
+
+        Raises:
+            (ValueError): a guild's shard isn't run by this client
+
+        Returns:
+            (dict[int, MemberChunks]): guild ID -> request, to iterate or await for its members
+        """
+        shards = {shard.shard_id: shard for shard in self.shards}
+        requests = {}
+
+        for guild_id in guild_ids:
+            shard_id = (int(guild_id) >> 22) % self.shards[0].total_shards if self.shards else None
+            shard = shards.get(shard_id)
+
+            if not shard:
+                raise ValueError(f"Guild {guild_id} is on shard {shard_id}, which this client doesn't run.")
+
+            requests[guild_id] = shard.request_guild_members(
+                int(guild_id), query=query, limit=limit, user_ids=user_ids, presences=presences, timeout=timeout
+            )
+
+        return requests
+
+    async def _run_handlers(self, handlers: list[callable], obj):
+        """Run an event's handlers in registration order.
+
+        Args:
+            handlers (list[callable]): listener functions for the event
+            obj (Event): the hydrated event
+        """
+        for handler in handlers:
+            try:
+                result = handler(obj)
+                if inspect.isawaitable(result):
+                    await result
+            except DiscordError as e:
+                logger.error(e)
+                continue
 
     async def listen_shard(self, shard: GatewayClient):
         """Consume a GatewayClient's event queue.
@@ -246,79 +478,189 @@ class Client:
 
         from .core.events import EVENTS
 
+        dispatcher = None
+        if self.dispatch_mode == DispatchModes.CONCURRENT:
+            dispatcher = ShardDispatcher(shard.shard_id, self.max_concurrent_handlers, self.ordering_key)
+
         while True:
             try:
                 dispatch_type, event_data = await shard.event_queue.get()
 
-                if dispatch_type not in self.events.keys():
+                # the cache sees every event, listened to or not
+                if self.cache:
+                    try:
+                        self.cache.update(dispatch_type, event_data)
+                    except Exception:
+                        logger.exception(f"SHARD ID {shard.shard_id}: Cache update failed for {dispatch_type}")
+
+                handlers = self.events.get(dispatch_type)
+
+                # nobody is listening: skip building the model entirely
+                if not handlers:
                     logger.debug(f"SHARD ID {shard.shard_id} DISPATCH -> {dispatch_type}")
-                else:
-                    logger.info(f"SHARD ID {shard.shard_id} DISPATCH -> {dispatch_type}")
+                    self.dropped_events[dispatch_type] = self.dropped_events.get(dispatch_type, 0) + 1
+                    continue
+
+                logger.info(f"SHARD ID {shard.shard_id} DISPATCH -> {dispatch_type}")
 
                 event_model = EVENTS.get(dispatch_type)
                 if not event_model:
                     logger.warning(f"Event {dispatch_type} is not implemented.")
                     continue
 
-                obj = event_model.from_dict(event_data)
+                if self.lazy_events:
+                    obj = event_model.lazy_from_dict(event_data)
+                else:
+                    obj = event_model.from_dict(event_data)
                 obj.name = dispatch_type
                 obj.raw = event_data
 
-                handlers = self.events.get(dispatch_type, [])
-                for handler in handlers:
-                    try:
-                        result = handler(obj)
-                        if inspect.isawaitable(result):
-                            await result
-                    except DiscordError as e:
-                        logger.error(e)
-                        continue
+                if dispatcher:
+                    await dispatcher.submit(dispatch_type, event_data, self._run_handlers, handlers, obj)
+                else:
+                    await self._run_handlers(handlers, obj)
 
             except Exception:
                 # catastrophic errors (network, shard death, unexpected OP code)
                 logger.exception(f"SHARD ID {shard.shard_id}: Dispatcher error")
                 continue
 
-    async def _start_shards(self, gateway: GatewayEvent):
-        """Starts all shards batching by max_concurrency."""
+    async def _start_shards(self, 
+        gateway: GatewayEvent, 
+        shard_ids: list[int], 
+        total_shards: int, 
+        identify_scheduler: IdentifyScheduler
+    ):
+        """Starts the given shards within the session start limit. 
+            Identifies are paced by `identify_scheduler`, which also holds the session start budget
+            so every process sharing it spends one budget. Shards with a saved session resume instead.
+        """
+        tasks = []
 
-        # pull important values for easier access
-        total_shards = gateway.shards
-        batch_size = gateway.session_start_limit.max_concurrency
+        logger.debug(f"Starting shards {shard_ids[0]}-{shard_ids[-1]} of {total_shards}")
 
-        tasks = []
-        
-        for batch_start in range(0, total_shards, batch_size):
-            batch_end = min(batch_start + batch_size, total_shards)
+        for shard_id in shard_ids:
+            shard = GatewayClient(
+                gateway.url, shard_id, total_shards, 
+                self._make_event_queue(), self.compress, self.codec, self.encoding,
+                identify_scheduler, self.session_store, 
+                lambda: self._spend_session_start(identify_scheduler)
+            )
 
-            logger.debug(f"Starting shards {batch_start}-{batch_end} of {total_shards}")
+            state = await self._load_session(shard_id, total_shards)
 
-            for shard_id in range(batch_start, batch_end):
-                shard = GatewayClient(gateway.url, shard_id, total_shards)
-                self.shards.append(shard)
+            if state:
+                # a resume does not count against the session start limit
+                shard.restore_session(state)
+                logger.debug(f"SHARD ID {shard_id}: Resuming saved session")
+            else:
+                await self._spend_session_start(identify_scheduler)
 
-                # fire and forget
-                tasks.append(asyncio.create_task(shard.start(self.token, self.intents)))
-                tasks.append(asyncio.create_task(self.listen_shard(shard)))
+            self.shards.append(shard)
 
-            # wait before next batch to respect identify rate limit
-            await asyncio.sleep(5)
+            # fire and forget
+            tasks.append(asyncio.create_task(shard.start(self.token, self.intents)))
+            tasks.append(asyncio.create_task(self.listen_shard(shard)))
 
         return tasks
     
+    async def _spend_session_start(self, identify_scheduler: IdentifyScheduler):
+        """Take a session start for an IDENTIFY, waiting for the limit to reset if the budget is spent.
+
+        Args:
+            identify_scheduler (IdentifyScheduler): holds the session start budget
+        """
+        while (wait := await identify_scheduler.spend_session_start()) > 0:
+            logger.warning(f"Session start limit reached. Waiting {wait:.0f}s for reset...")
+            await asyncio.sleep(wait)
+
+            # re-read the budget: other hosts may have spent some of it (reset_after is in ms)
+            data = await self._http.request('GET', '/gateway/bot')
+            if data:
+                limit = GatewayEvent.from_dict(data).session_start_limit
+                await identify_scheduler.refill_session_starts(limit.remaining, limit.reset_after / 1000)
+
+    async def _load_session(self, shard_id: int, total_shards: int):
+        """Load a shard's saved session from the session store.
+
+        Args:
+            shard_id (int): ID of the shard
+            total_shards (int): total shard count
+
+        Returns:
+            (SessionState | None): saved session or None
+        """
+        if not self.session_store:
+            return None
+        
+        try:
+            return await self.session_store.load(shard_id, total_shards)
+        except Exception:
+            logger.exception(f"SHARD ID {shard_id}: Could not load saved session")
+
+    async def _save_sessions(self):
+        """Save every shard's session to the session store."""
+
+        for shard in self.shards:
+            state = shard.session_state()
+            if not state:
+                continue
+
+            try:
+                await self.session_store.save(shard.shard_id, shard.total_shards, state)
+            except Exception:
+                logger.exception(f"SHARD ID {shard.shard_id}: Could not save session")
+
     async def start(self):
         """Starts the HTTP/Websocket client, run startup logic, and registers commands."""
         
+        await self._start(self.shard_ids, self.total_shards)
+
+    async def _start(self, 
+        shard_ids: list[int] = None, 
+        total_shards: int = None, 
+        identify_scheduler: IdentifyScheduler = None
+    ):
+        """Starts the client for a set of shards.
+
+        Args:
+            shard_ids (list[int], optional): shards to run. Defaults to every shard.
+            total_shards (int, optional): shard count across all processes. Defaults to Discord's recommendation.
+            identify_scheduler (IdentifyScheduler, optional): identify pacing shared with other processes.
+                Defaults to a scheduler local to this client.
+
+        Returns:
+            (bool): False if the client could not start or crashed, True if it was stopped or its shards closed
+        """
         try:
             await self._http.start(self.token)
 
             data = await self._http.request('GET', '/gateway/bot')
 
             if not data:
-                return
+                logger.error("Could not fetch gateway info. Client not started.")
+                return False
 
             gateway = GatewayEvent.from_dict(data)
 
+            total_shards = total_shards or gateway.shards
+            shard_ids = shard_ids if shard_ids is not None else list(range(total_shards))
+
+            if not all(0 <= i < total_shards for i in shard_ids):
+                logger.error(f"Shard IDs {shard_ids} do not fit in {total_shards} shards.")
+                return False
+            
+            limit = gateway.session_start_limit
+            logger.info(
+                f"Starting {len(shard_ids)} of {total_shards} shards. "
+                f"Session starts remaining: {limit.remaining}/{limit.total}"
+            )
+
+            identify_scheduler = identify_scheduler or IdentifyScheduler(limit.max_concurrency)
+
+            # a no-op if another worker already set this window's budget
+            await identify_scheduler.refill_session_starts(limit.remaining, limit.reset_after / 1000)
+
             for hook in self.startup_hooks:
                 try:
                     result = hook()
@@ -327,15 +669,21 @@ class Client:
                 except Exception:
                     logger.exception("Error in shartup hook")
 
-            tasks = await asyncio.create_task(self._start_shards(gateway))
+            tasks = await asyncio.create_task(
+                self._start_shards(gateway, shard_ids, total_shards, identify_scheduler)
+            )
 
             # end all ongoing tasks
             await asyncio.gather(*tasks)
+
+            return True
             
         except asyncio.CancelledError:
             logger.info("Connection cancelled via KeyboardInterrupt.")
+            return True
         except Exception:
-            logger.error(f"Unhandled client start exception.")
+            logger.exception(f"Unhandled client start exception.")
+            return False
         finally:
             await self._close()
 
@@ -353,8 +701,14 @@ class Client:
         logger.info("Closing HTTP session...")
         await self._http.close()
 
+        # a 1000 close ends the session on Discord's side, so keep it open when it's saved for resume
+        close_code = 1000
+        if self.session_store:
+            await self._save_sessions()
+            close_code = RESUMABLE_CLOSE_CODE
+
         # close each connection or shard
-        await asyncio.gather(*[shard.close_ws() for shard in self.shards])
+        await asyncio.gather(*[shard.close_ws(close_code) for shard in self.shards])
     
     def run(self):
         """User-facing entry point for starting the client."""  
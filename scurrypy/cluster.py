@@ -0,0 +1,169 @@
+import asyncio
+import multiprocessing
+import sys
+import time
+
+from .core.identify import IdentifyCoordinator
+from .events.gateway_events import GatewayEvent
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _run_worker(client_factory, shard_ids: list[int], total_shards: int, coordinator: IdentifyCoordinator):
+    """Worker process entry point: build a client and run its shard range.
+
+    Args:
+        client_factory (callable): builds the worker's `Client`
+        shard_ids (list[int]): shards this worker runs
+        total_shards (int): shard count across the whole cluster
+        coordinator (IdentifyCoordinator): identify scheduler shared by all workers
+    """
+    client = client_factory()
+
+    try:
+        started = asyncio.run(client._start(shard_ids, total_shards, coordinator))
+    except KeyboardInterrupt:
+        return
+
+    # a non-zero exit code tells the supervisor to restart this worker
+    if not started:
+        sys.exit(1)
+
+class Cluster:
+    """Runs shards across worker processes, each with its own gateways and dispatcher.
+        Workers share one identify coordinator, so `max_concurrency` holds cluster-wide.
+        A crashed worker is restarted alone; healthy workers keep their shards.
+
+    !!! important
+        `client_factory` must be a module-level function. Workers are spawned, not forked,
+        so the factory is imported fresh in each process and registers its own listeners.
+    """
+
+    client_factory: callable
+    """Builds a fully configured `Client` (listeners, hooks)."""
+
+    workers: int
+    """Number of worker processes."""
+
+    restart_delay: float
+    """Seconds to wait before restarting a crashed worker."""
+
+    def __init__(self, client_factory, *, workers: int = None, restart_delay: float = 5):
+        """
+        Args:
+            client_factory (callable): module-level function returning a `Client`
+            workers (int, optional): worker process count. Defaults to the CPU count.
+            restart_delay (float, optional): seconds before restarting a crashed worker. Defaults to 5.
+        """
+        self.client_factory = client_factory
+        self.workers = workers or multiprocessing.cpu_count()
+        self.restart_delay = restart_delay
+
+        self._ctx = multiprocessing.get_context('spawn')
+        self._processes: dict[int, multiprocessing.Process] = {}
+        self._shard_ranges: dict[int, list[int]] = {}
+
+    async def _fetch_gateway(self, client):
+        """Fetch the shard count and session start limit once for the whole cluster.
+
+        Args:
+            client (Client): a client built by the factory
+
+        Returns:
+            (GatewayEvent | None): gateway info or None if the request failed
+        """
+        try:
+            await client._http.start(client.token)
+            data = await client._http.request('GET', '/gateway/bot')
+        finally:
+            await client._http.close()
+
+        return GatewayEvent.from_dict(data) if data else None
+
+    def _spawn(self, worker_id: int, total_shards: int, coordinator: IdentifyCoordinator):
+        """Start (or restart) one worker process.
+
+        Args:
+            worker_id (int): index of the worker
+            total_shards (int): shard count across the cluster
+            coordinator (IdentifyCoordinator): shared identify pacing
+        """
+        shard_ids = self._shard_ranges[worker_id]
+
+        process = self._ctx.Process(
+            target=_run_worker,
+            args=(self.client_factory, shard_ids, total_shards, coordinator),
+            name=f"scurrypy-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        self._processes[worker_id] = process
+
+        logger.info(f"Worker {worker_id} (pid {process.pid}) started shards {shard_ids[0]}-{shard_ids[-1]}")
+
+    def run(self):
+        """Split shards across workers and supervise them until interrupted.
+            Honors the client's `shard_ids` and `total_shards` if set.
+        """
+        client = self.client_factory()
+
+        gateway = asyncio.run(self._fetch_gateway(client))
+
+        if not gateway:
+            logger.error("Could not fetch gateway info. Cluster not started.")
+            return
+
+        total_shards = client.total_shards or gateway.shards
+        shard_ids = client.shard_ids if client.shard_ids is not None else list(range(total_shards))
+        workers = min(self.workers, len(shard_ids))
+
+        coordinator = IdentifyCoordinator(gateway.session_start_limit.max_concurrency, ctx=self._ctx)
+
+        # contiguous shard ranges, as even as possible
+        per_worker, extra = divmod(len(shard_ids), workers)
+        start = 0
+        for worker_id in range(workers):
+            end = start + per_worker + (1 if worker_id < extra else 0)
+            self._shard_ranges[worker_id] = shard_ids[start:end]
+            start = end
+
+        for worker_id in self._shard_ranges:
+            self._spawn(worker_id, total_shards, coordinator)
+
+        # worker ID -> time.monotonic() when a crashed worker is due to restart
+        restart_at: dict[int, float] = {}
+
+        try:
+            while True:
+                time.sleep(1)
+
+                for worker_id, process in list(self._processes.items()):
+                    if process.is_alive() or process.exitcode == 0:
+                        continue
+
+                    # each crashed worker waits out its own delay; the others stay supervised meanwhile
+                    if worker_id not in restart_at:
+                        logger.error(
+                            f"Worker {worker_id} exited with code {process.exitcode}. "
+                            f"Restarting in {self.restart_delay}s..."
+                        )
+                        restart_at[worker_id] = time.monotonic() + self.restart_delay
+
+                    elif time.monotonic() >= restart_at[worker_id]:
+                        del restart_at[worker_id]
+                        self._spawn(worker_id, total_shards, coordinator)
+
+                if not restart_at and not any(p.is_alive() for p in self._processes.values()):
+                    logger.info("All workers exited.")
+                    break
+
+        except KeyboardInterrupt:
+            logger.info("Stopping workers...")
+        finally:
+            # workers got the same interrupt; give them time to close cleanly
+            for process in self._processes.values():
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
@@ -5,11 +5,25 @@ from .model import DataModel
 from .intents import Intents
 from .permissions import Permissions
 from .addon import Addon
+from .dispatch import DispatchModes, OrderingKeys
+from .event_queue import OverflowPolicies
+from .session_store import SessionStore, MemorySessionStore, FileSessionStore
+from .cache import EntityCache, CachePolicies
+from .member_chunks import MemberChunks
 
 __all__ = [
     "Addon",
+    "CachePolicies",
     "DataModel",
+    "DispatchModes",
     "DiscordError",
+    "EntityCache",
+    "FileSessionStore",
     "Intents",
-    "Permissions"
+    "MemberChunks",
+    "MemorySessionStore",
+    "OrderingKeys",
+    "OverflowPolicies",
+    "Permissions",
+    "SessionStore"
 ]
@@ -0,0 +1,584 @@
+from collections import OrderedDict
+from typing import Hashable
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CachePolicies:
+    """How long an entity type stays in the [`EntityCache`][scurrypy.core.cache.EntityCache]."""
+
+    NONE = 'none'
+    """Not cached. `get_*` always fetches."""
+
+    LRU = 'lru'
+    """Keep the most recently used entities, up to the cache's `max_size` per type."""
+
+    FULL = 'full'
+    """Keep everything the gateway sends until it is deleted."""
+
+    COMPACT = 'compact'
+    """Members only. Keep every member like `FULL`, packed down to the fields `GuildMemberModel` reads.
+        See [`CompactMemberStore`][scurrypy.core.cache.CompactMemberStore].
+    """
+
+GUILD_COLLECTIONS = ('members', 'channels', 'threads', 'roles', 'presences', 'voice_states', 'stage_instances')
+"""GUILD_CREATE fields cached as their own entities (or not at all) instead of on the guild."""
+
+class EntityStore:
+    """Raw payloads of one entity type, keyed by snowflake, with a retention policy."""
+
+    def __init__(self, policy: str, max_size: int):
+        """
+        Args:
+            policy (str): see [`CachePolicies`][scurrypy.core.cache.CachePolicies]
+            max_size (int): max entities kept under the `LRU` policy
+
+        Raises:
+            (ValueError): invalid policy
+        """
+        if policy not in (CachePolicies.NONE, CachePolicies.LRU, CachePolicies.FULL):
+            raise ValueError(f"Invalid cache policy: {policy}")
+
+        self.policy = policy
+        self.max_size = max_size
+        self.items: OrderedDict[Hashable, dict] = OrderedDict()
+
+    def get(self, key: Hashable):
+        """Look up an entity. Counts as a use under `LRU`.
+
+        Args:
+            key (Hashable): entity key
+
+        Returns:
+            (dict | None): raw payload or None if not cached
+        """
+        data = self.items.get(key)
+
+        if data is not None and self.policy == CachePolicies.LRU:
+            self.items.move_to_end(key)
+
+        return data
+
+    def set(self, key: Hashable, data: dict):
+        """Add or replace an entity, evicting the least recently used one under `LRU` if full.
+
+        Args:
+            key (Hashable): entity key
+            data (dict): raw payload
+        """
+        if self.policy == CachePolicies.NONE:
+            return
+
+        self.items[key] = data
+
+        if self.policy == CachePolicies.LRU:
+            self.items.move_to_end(key)
+            if len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Remove an entity.
+
+        Args:
+            key (Hashable): entity key
+        """
+        self.items.pop(key, None)
+
+    def __len__(self):
+        return len(self.items)
+
+class PackedUser:
+    """User fields kept by a [`CompactMemberStore`][scurrypy.core.cache.CompactMemberStore], 
+        shared by every guild the user is a member of.
+    """
+
+    __slots__ = ('id', 'username', 'discriminator', 'global_name', 'avatar', 'bot', 'system', 'banner', 'accent_color', 'refs')
+
+    def __init__(self, user: dict):
+        """
+        Args:
+            user (dict): raw user payload
+        """
+        self.id = int(user['id'])
+        self.refs = 0
+        self.update(user)
+
+    def update(self, user: dict):
+        """Refresh the kept fields from a newer payload.
+
+        Args:
+            user (dict): raw user payload
+        """
+        self.username = user.get('username')
+        self.discriminator = user.get('discriminator')
+        self.global_name = user.get('global_name')
+        self.avatar = user.get('avatar')
+        self.bot = user.get('bot')
+        self.system = user.get('system')
+        self.banner = user.get('banner')
+        self.accent_color = user.get('accent_color')
+
+    def unpack(self):
+        """
+        Returns:
+            (dict): user payload with the kept fields
+        """
+        return {
+            'id': self.id, 
+            'username': self.username, 
+            'discriminator': self.discriminator, 
+            'global_name': self.global_name, 
+            'avatar': self.avatar, 
+            'bot': self.bot, 
+            'system': self.system, 
+            'banner': self.banner, 
+            'accent_color': self.accent_color
+        }
+
+class PackedMember:
+    """Fields of a guild member that `GuildMemberModel` reads, with its user shared and role IDs as ints."""
+
+    __slots__ = ('user', 'roles', 'nick', 'avatar', 'joined_at', 'deaf', 'mute', 'flags')
+
+    def __init__(self, user: PackedUser, roles: tuple[int], member: dict):
+        """
+        Args:
+            user (PackedUser): the member's shared user
+            roles (tuple[int]): the member's role IDs
+            member (dict): raw member payload
+        """
+        self.user = user
+        self.roles = roles
+        self.nick = member.get('nick')
+        self.avatar = member.get('avatar')
+
+        # kept as sent: reformatting a parsed timestamp wouldn't round-trip exactly
+        self.joined_at = member.get('joined_at')
+
+        self.deaf = member.get('deaf')
+        self.mute = member.get('mute')
+        self.flags = member.get('flags')
+
+    def unpack(self, guild_id: int):
+        """
+        Args:
+            guild_id (int): ID of the member's guild
+
+        Returns:
+            (dict): member payload with the kept fields
+        """
+        return {
+            'guild_id': guild_id,
+            'user': self.user.unpack(),
+            'roles': list(self.roles),
+            'nick': self.nick,
+            'avatar': self.avatar,
+            'joined_at': self.joined_at,
+            'deaf': self.deaf,
+            'mute': self.mute,
+            'flags': self.flags
+        }
+
+class CompactMemberStore:
+    """Members stored as [`PackedMember`][scurrypy.core.cache.PackedMember]s per guild, 
+        with users deduplicated across guilds. Payloads are rebuilt on read.
+
+    !!! note
+        Only fields of `GuildMemberModel` and `UserModel` are kept, so members hydrate the same as under `FULL`.
+        Other payload keys (e.g. `premium_since`, `avatar_decoration_data`) are dropped.
+    """
+
+    def __init__(self):
+        self.policy = CachePolicies.COMPACT
+
+        self.guilds: dict[int, dict[int, PackedMember]] = {}
+        """Guild ID -> user ID -> packed member."""
+
+        self.users: dict[int, PackedUser] = {}
+        """User ID -> packed user, dropped once no guild holds it."""
+
+        self.role_ids: dict[int, dict[int, int]] = {}
+        """Guild ID -> role ID -> the one int object its members' role tuples point at. Dropped with the guild or role."""
+
+    def get(self, key: tuple[int, int]):
+        """Look up a member.
+
+        Args:
+            key (tuple[int, int]): `(guild ID, user ID)`
+
+        Returns:
+            (dict | None): member payload or None if not cached
+        """
+        guild_id, user_id = key
+        member = self.guilds.get(guild_id, {}).get(user_id)
+
+        return None if member is None else member.unpack(guild_id)
+
+    def set(self, key: tuple[int, int], data: dict):
+        """Add or replace a member.
+
+        Args:
+            key (tuple[int, int]): `(guild ID, user ID)`
+            data (dict): raw member payload
+        """
+        guild_id, user_id = key
+        members = self.guilds.setdefault(guild_id, {})
+
+        user = self.users.get(user_id)
+        if user is None:
+            user = PackedUser(data['user'])
+            self.users[user.id] = user
+        else:
+            user.update(data['user'])
+
+        if user_id not in members:
+            user.refs += 1
+
+        # roles repeat across members: share their ints instead of allocating per member
+        role_ids = self.role_ids.setdefault(guild_id, {})
+        roles = tuple(role_ids.setdefault(r, r) for r in map(int, data.get('roles') or ()))
+
+        # key by the user's own int so both tables share it
+        members[user.id] = PackedMember(user, roles, data)
+
+    def pop(self, key: tuple[int, int]):
+        """Remove a member.
+
+        Args:
+            key (tuple[int, int]): `(guild ID, user ID)`
+        """
+        guild_id, user_id = key
+        member = self.guilds.get(guild_id, {}).pop(user_id, None)
+
+        if member is not None:
+            self._release(member.user)
+
+    def pop_guild(self, guild_id: int):
+        """Remove every member of a guild.
+
+        Args:
+            guild_id (int): ID of the guild
+        """
+        for member in self.guilds.pop(guild_id, {}).values():
+            self._release(member.user)
+
+        self.role_ids.pop(guild_id, None)
+
+    def pop_role(self, guild_id: int, role_id: int):
+        """Stop sharing a deleted role's int. Members still holding it keep their copy.
+
+        Args:
+            guild_id (int): ID of the guild
+            role_id (int): ID of the role
+        """
+        self.role_ids.get(guild_id, {}).pop(role_id, None)
+
+    def _release(self, user: PackedUser):
+        """Drop a member's hold on its user, and the user once nobody holds it."""
+
+        user.refs -= 1
+        if user.refs == 0:
+            self.users.pop(user.id, None)
+
+    def __len__(self):
+        return sum(len(members) for members in self.guilds.values())
+
+class EntityCache:
+    """Opt-in cache of guilds, channels, roles, members, and users, kept up to date from gateway events.
+        Entities are stored as raw payloads and hydrated into models on read.
+
+    !!! note
+        Only holds what the gateway sends; members need the `GUILD_MEMBERS` intent to stay current.
+    """
+
+    def __init__(self, *,
+        guilds: str = CachePolicies.FULL,
+        channels: str = CachePolicies.FULL,
+        roles: str = CachePolicies.FULL,
+        members: str = CachePolicies.LRU,
+        users: str = CachePolicies.LRU,
+        max_size: int = 10_000
+    ):
+        """
+        Args:
+            guilds (str, optional): guild retention. Defaults to `CachePolicies.FULL`.
+            channels (str, optional): channel retention. Defaults to `CachePolicies.FULL`.
+            roles (str, optional): role retention. Defaults to `CachePolicies.FULL`.
+            members (str, optional): guild member retention. `CachePolicies.COMPACT` keeps every member 
+                in a fraction of the memory. Defaults to `CachePolicies.LRU`.
+            users (str, optional): user retention. Defaults to `CachePolicies.LRU`.
+            max_size (int, optional): max entities per type under `LRU`. Defaults to 10,000.
+        """
+        self.guilds = EntityStore(guilds, max_size)
+        """Guild ID -> guild payload (without its collections)."""
+
+        self.channels = EntityStore(channels, max_size)
+        """Channel ID -> channel payload."""
+
+        self.roles = EntityStore(roles, max_size)
+        """Role ID -> role payload."""
+
+        self.members = CompactMemberStore() if members == CachePolicies.COMPACT else EntityStore(members, max_size)
+        """`(guild ID, user ID)` -> member payload."""
+
+        self.users = EntityStore(users, max_size)
+        """User ID -> user payload."""
+
+        self.guild_channels: dict[int, set[int]] = {}
+        """Guild ID -> IDs of its channels."""
+
+        self.guild_roles: dict[int, set[int]] = {}
+        """Guild ID -> IDs of its roles."""
+
+        self.handlers = {
+            'GUILD_CREATE': self._guild_create,
+            'GUILD_UPDATE': self._guild_update,
+            'GUILD_DELETE': self._guild_delete,
+            'CHANNEL_CREATE': self._channel_update,
+            'CHANNEL_UPDATE': self._channel_update,
+            'CHANNEL_DELETE': self._channel_delete,
+            'THREAD_CREATE': self._channel_update,
+            'THREAD_UPDATE': self._channel_update,
+            'THREAD_DELETE': self._channel_delete,
+            'GUILD_ROLE_CREATE': self._role_update,
+            'GUILD_ROLE_UPDATE': self._role_update,
+            'GUILD_ROLE_DELETE': self._role_delete,
+            'GUILD_MEMBER_ADD': self._member_update,
+            'GUILD_MEMBER_UPDATE': self._member_update,
+            'GUILD_MEMBER_REMOVE': self._member_remove,
+            'GUILD_MEMBERS_CHUNK': self._members_chunk
+        }
+        """Dispatch name -> handler updating the cache."""
+
+    def update(self, dispatch_type: str, data: dict):
+        """Apply a gateway event to the cache. Events that don't carry cached state are ignored.
+
+        Args:
+            dispatch_type (str): dispatch name of the event
+            data (dict): raw event payload
+        """
+        handler = self.handlers.get(dispatch_type)
+
+        # snowflakes arrive as str (JSON) or int (ETF): handlers key everything by int
+        if handler and isinstance(data, dict):
+            handler(data)
+
+    def _guild_create(self, data: dict):
+        """Cache a guild with its channels, threads, roles, and members."""
+
+        guild_id = int(data['id'])
+
+        if data.get('unavailable'):
+            return
+
+        self.guilds.set(guild_id, {k: v for k, v in data.items() if k not in GUILD_COLLECTIONS})
+
+        for channel in data.get('channels', []) + data.get('threads', []):
+            # channels in GUILD_CREATE leave out their guild ID
+            self._channel_update({**channel, 'guild_id': data['id']})
+
+        for role in data.get('roles', []):
+            self._role_update({'guild_id': data['id'], 'role': role})
+
+        self._members_chunk({'guild_id': data['id'], 'members': data.get('members', [])})
+
+    def _guild_update(self, data: dict):
+        """Replace a guild."""
+
+        guild_id = int(data['id'])
+
+        # GUILD_UPDATE carries the full guild; roles get their own events
+        self.guilds.set(guild_id, {k: v for k, v in data.items() if k not in GUILD_COLLECTIONS})
+
+    def _guild_delete(self, data: dict):
+        """Drop a guild and everything cached under it. An outage only marks the guild unavailable."""
+
+        guild_id = int(data['id'])
+
+        # `unavailable` is only set during an outage; the bot is still in the guild
+        if data.get('unavailable'):
+            guild = self.guilds.get(guild_id)
+            if guild is not None:
+                guild['unavailable'] = True
+            return
+
+        self.guilds.pop(guild_id)
+
+        for channel_id in self.guild_channels.pop(guild_id, ()):
+            self.channels.pop(channel_id)
+
+        for role_id in self.guild_roles.pop(guild_id, ()):
+            self.roles.pop(role_id)
+
+        if isinstance(self.members, CompactMemberStore):
+            self.members.pop_guild(guild_id)
+
+        # members are keyed by guild; only scan for them when they're cached
+        elif len(self.members):
+            for key in [key for key in self.members.items if key[0] == guild_id]:
+                self.members.pop(key)
+
+    def _channel_update(self, data: dict):
+        """Add or replace a channel or thread."""
+
+        if self.channels.policy == CachePolicies.NONE:
+            return
+
+        channel_id = int(data['id'])
+
+        self.channels.set(channel_id, data)
+
+        if data.get('guild_id') is not None:
+            self.guild_channels.setdefault(int(data['guild_id']), set()).add(channel_id)
+
+    def _channel_delete(self, data: dict):
+        """Drop a channel or thread."""
+
+        channel_id = int(data['id'])
+
+        self.channels.pop(channel_id)
+
+        if data.get('guild_id') is not None:
+            self.guild_channels.get(int(data['guild_id']), set()).discard(channel_id)
+
+    def _role_update(self, data: dict):
+        """Add or replace a role."""
+
+        if self.roles.policy == CachePolicies.NONE:
+            return
+
+        role_id = int(data['role']['id'])
+
+        self.roles.set(role_id, data['role'])
+        self.guild_roles.setdefault(int(data['guild_id']), set()).add(role_id)
+
+    def _role_delete(self, data: dict):
+        """Drop a role."""
+
+        role_id = int(data['role_id'])
+
+        self.roles.pop(role_id)
+        self.guild_roles.get(int(data['guild_id']), set()).discard(role_id)
+
+        if isinstance(self.members, CompactMemberStore):
+            self.members.pop_role(int(data['guild_id']), role_id)
+
+    def _member_update(self, data: dict):
+        """Add or replace a member and its user."""
+
+        user = data['user']
+        user_id = int(user['id'])
+
+        self.users.set(user_id, user)
+        self.members.set((int(data['guild_id']), user_id), data)
+
+    def _member_remove(self, data: dict):
+        """Drop a member. The user stays; it may share other guilds."""
+
+        self.members.pop((int(data['guild_id']), int(data['user']['id'])))
+
+    def _members_chunk(self, data: dict):
+        """Cache a batch of members of one guild."""
+
+        guild_id = data['guild_id']
+
+        # skip the work entirely if neither store keeps anything
+        if self.members.policy == CachePolicies.NONE and self.users.policy == CachePolicies.NONE:
+            return
+
+        for member in data.get('members', []):
+            self._member_update({**member, 'guild_id': guild_id})
+
+    def get_guild(self, guild_id: int):
+        """Look up a guild.
+
+        Args:
+            guild_id (int): ID of the guild
+
+        Returns:
+            (dict | None): guild payload with its cached roles, or None if not cached
+        """
+        data = self.guilds.get(int(guild_id))
+
+        if data is None:
+            return None
+
+        return {**data, 'roles': self.get_guild_roles(guild_id) or []}
+
+    def get_channel(self, channel_id: int):
+        """Look up a channel.
+
+        Args:
+            channel_id (int): ID of the channel
+
+        Returns:
+            (dict | None): channel payload or None if not cached
+        """
+        return self.channels.get(int(channel_id))
+
+    def get_guild_channels(self, guild_id: int):
+        """Look up every channel of a guild. Only complete under the `FULL` policy.
+
+        Args:
+            guild_id (int): ID of the guild
+
+        Returns:
+            (list[dict] | None): channel payloads or None if not known
+        """
+        if self.channels.policy != CachePolicies.FULL or int(guild_id) not in self.guild_channels:
+            return None
+
+        return [self.channels.get(i) for i in self.guild_channels[int(guild_id)]]
+
+    def get_role(self, role_id: int, guild_id: int = None):
+        """Look up a role.
+
+        Args:
+            role_id (int): ID of the role
+            guild_id (int, optional): only return the role if it belongs to this guild. Defaults to None.
+
+        Returns:
+            (dict | None): role payload or None if not cached
+        """
+        if guild_id is not None and int(role_id) not in self.guild_roles.get(int(guild_id), ()):
+            return None
+
+        return self.roles.get(int(role_id))
+
+    def get_guild_roles(self, guild_id: int):
+        """Look up every role of a guild. Only complete under the `FULL` policy.
+
+        Args:
+            guild_id (int): ID of the guild
+
+        Returns:
+            (list[dict] | None): role payloads or None if not known
+        """
+        if self.roles.policy != CachePolicies.FULL or int(guild_id) not in self.guild_roles:
+            return None
+
+        return [self.roles.get(i) for i in self.guild_roles[int(guild_id)]]
+
+    def get_member(self, guild_id: int, user_id: int):
+        """Look up a guild member.
+
+        Args:
+            guild_id (int): ID of the guild
+            user_id (int): ID of the user
+
+        Returns:
+            (dict | None): member payload or None if not cached
+        """
+        return self.members.get((int(guild_id), int(user_id)))
+
+    def get_user(self, user_id: int):
+        """Look up a user.
+
+        Args:
+            user_id (int): ID of the user
+
+        Returns:
+            (dict | None): user payload or None if not cached
+        """
+        return self.users.get(int(user_id))
@@ -0,0 +1,86 @@
+import json
+from typing import Any
+
+class JSONCodec:
+    """JSON encoder/decoder shared by the gateway and HTTP clients. Uses the standard library."""
+
+    name = 'json'
+    """Name used to select this codec."""
+
+    def encode(self, obj: Any) -> bytes:
+        """Serialize an object to JSON.
+
+        Args:
+            obj (Any): object to serialize
+
+        Returns:
+            (bytes): UTF-8 JSON
+        """
+        return json.dumps(obj).encode()
+
+    def decode(self, data: bytes | str) -> Any:
+        """Deserialize JSON.
+
+        Args:
+            data (bytes | str): JSON document
+
+        Returns:
+            (Any): deserialized object
+        """
+        return json.loads(data)
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by `orjson`. Requires `pip install orjson`."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        self.encode = orjson.dumps
+        self.decode = orjson.loads
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by `msgspec`. Requires `pip install msgspec`."""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec
+
+        self.encode = msgspec.json.Encoder().encode
+        self.decode = msgspec.json.Decoder().decode
+
+CODECS = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec
+}
+"""Maps codec name -> codec class."""
+
+def get_codec(name: str = 'json'):
+    """Build a codec by name.
+
+    Args:
+        name (str, optional): `json`, `orjson`, `msgspec`, or `auto` to pick the fastest installed. Defaults to `json`.
+
+    Raises:
+        (ValueError): unknown codec name
+        (ImportError): the codec's library is not installed
+
+    Returns:
+        (JSONCodec): the codec
+    """
+    if name == 'auto':
+        for codec in (OrjsonCodec, MsgspecCodec):
+            try:
+                return codec()
+            except ImportError:
+                continue
+        return JSONCodec()
+
+    codec = CODECS.get(name)
+    if not codec:
+        raise ValueError(f"Invalid JSON codec: {name}")
+
+    return codec()
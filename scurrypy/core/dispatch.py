@@ -0,0 +1,180 @@
+import asyncio
+from typing import Hashable
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DispatchModes:
+    """How the client runs event handlers."""
+
+    SEQUENTIAL = 'sequential'
+    """Await every event's handlers before pulling the next event. (default)"""
+
+    CONCURRENT = 'concurrent'
+    """Run handlers as tasks with bounded concurrency per shard. Events sharing an ordering key stay in order."""
+
+class OrderingKeys:
+    """Built-in ordering keys for concurrent dispatch.
+        An ordering key maps `(dispatch_type, event_data)` to a hashable key or `None`.
+        Events with the same key run one after another. Events with no key run freely.
+    """
+
+    @staticmethod
+    def guild(dispatch_type: str, data: dict):
+        """Keep events of the same guild in order.
+
+        Args:
+            dispatch_type (str): dispatch name of the event
+            data (dict): raw event payload
+
+        Returns:
+            (Hashable | None): guild ID if the event belongs to a guild
+        """
+        if not isinstance(data, dict):
+            return None
+
+        guild_id = data.get('guild_id')
+        if guild_id is None and dispatch_type.startswith('GUILD_'):
+            guild_id = data.get('id')
+
+        return guild_id
+
+    @staticmethod
+    def channel(dispatch_type: str, data: dict):
+        """Keep events of the same channel in order. Falls back to the guild for channel-less events.
+
+        Args:
+            dispatch_type (str): dispatch name of the event
+            data (dict): raw event payload
+
+        Returns:
+            (Hashable | None): channel ID, or guild ID if the event has no channel
+        """
+        if not isinstance(data, dict):
+            return None
+
+        channel_id = data.get('channel_id')
+        if channel_id is None and dispatch_type.startswith('CHANNEL_'):
+            channel_id = data.get('id')
+
+        if channel_id is not None:
+            return ('channel', channel_id)
+
+        guild_id = OrderingKeys.guild(dispatch_type, data)
+        if guild_id is not None:
+            return ('guild', guild_id)
+
+class ShardDispatcher:
+    """Runs event handlers for one shard as tasks with bounded concurrency.
+        Events sharing an ordering key are chained so they run in arrival order.
+        An event only takes a concurrency slot once the events ahead of it on its key are done,
+        so a busy key can't starve the others.
+    """
+
+    def __init__(self, shard_id: int, max_concurrency: int, ordering_key = None):
+        """
+        Args:
+            shard_id (int): ID of the shard this dispatcher serves
+            max_concurrency (int): max events whose handlers run at once
+            ordering_key (callable, optional): maps `(dispatch_type, event_data)` to an ordering key.
+                See [`OrderingKeys`][scurrypy.core.dispatch.OrderingKeys].
+        """
+        self.shard_id = shard_id
+        self.ordering_key = ordering_key
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+        self.max_backlog = max_concurrency
+        """Max events pending per ordering key (events with no key count as one key)."""
+
+        self.backlogs: dict[Hashable, asyncio.Semaphore] = {}
+        """Maps ordering key -> slots left in its backlog."""
+
+        self.pending: dict[Hashable, int] = {}
+        """Maps ordering key -> events submitted or waiting to be, to drop idle backlogs."""
+
+        self.tails: dict[Hashable, asyncio.Task] = {}
+        """Maps ordering key -> last task submitted with that key."""
+
+        self.tasks: set[asyncio.Task] = set()
+        """Tasks still running (keeps strong references)."""
+
+    async def submit(self, dispatch_type: str, event_data: dict, run, *args):
+        """Schedule `run(*args)` for an event. Blocks while `max_backlog` events with the same key are pending.
+
+        Args:
+            dispatch_type (str): dispatch name of the event
+            event_data (dict): raw event payload
+            run (callable): coroutine function running the event's handlers
+            *args: arguments for `run`
+        """
+        key = self.ordering_key(dispatch_type, event_data) if self.ordering_key else None
+
+        backlog = self.backlogs.get(key)
+        if backlog is None:
+            backlog = self.backlogs[key] = asyncio.Semaphore(self.max_backlog)
+
+        self.pending[key] = self.pending.get(key, 0) + 1
+
+        try:
+            await backlog.acquire()
+        except BaseException:
+            self._release_backlog(key, acquired=False)
+            raise
+
+        prev = self.tails.get(key) if key is not None else None
+
+        task = asyncio.create_task(self._run(prev, run, *args))
+        self.tasks.add(task)
+
+        if key is not None:
+            self.tails[key] = task
+
+        task.add_done_callback(lambda t: self._done(t, key))
+
+    async def _run(self, prev: asyncio.Task | None, run, *args):
+        """Wait for the previous event with the same key, then run the handlers.
+
+        Args:
+            prev (asyncio.Task | None): task of the previous event with the same key
+            run (callable): coroutine function running the event's handlers
+            *args: arguments for `run`
+        """
+        if prev:
+            # only wait for completion; prev reports its own errors
+            await asyncio.wait([prev])
+
+        # take a slot only once it's this event's turn on its key
+        async with self.semaphore:
+            try:
+                await run(*args)
+            except Exception:
+                logger.exception(f"SHARD ID {self.shard_id}: Handler task error")
+
+    def _done(self, task: asyncio.Task, key: Hashable | None):
+        """Free the backlog slot and forget the task once it finishes.
+
+        Args:
+            task (asyncio.Task): the finished task
+            key (Hashable | None): ordering key of the task
+        """
+        self._release_backlog(key)
+        self.tasks.discard(task)
+
+        if key is not None and self.tails.get(key) is task:
+            del self.tails[key]
+
+    def _release_backlog(self, key: Hashable | None, acquired: bool = True):
+        """Give back a backlog slot, and drop the key's backlog once nothing is pending on it.
+
+        Args:
+            key (Hashable | None): ordering key
+            acquired (bool, optional): whether the slot was taken. Defaults to True.
+        """
+        if acquired:
+            self.backlogs[key].release()
+
+        self.pending[key] -= 1
+        if not self.pending[key]:
+            del self.pending[key]
+            del self.backlogs[key]
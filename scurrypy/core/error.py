@@ -6,8 +6,13 @@ class DiscordError(Exception):
             Extracts reason, code, and walks the nested errors.
 
         Args:
-            data (dict): Discord's error JSON
+            status (int): HTTP status code
+            data (dict | str): Discord's error JSON, or the raw body if it was not JSON
         """
+        if not isinstance(data, dict):
+            # e.g. an HTML page from a 502
+            data = {'message': data or f"HTTP {status}"}
+
         self.data = data
         self.status = status
         self.reason = data.get('message', data)
@@ -0,0 +1,190 @@
+import asyncio
+from collections import deque
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class OverflowPolicies:
+    """What a full event queue does with the next event."""
+
+    BLOCK = 'block'
+    """Wait for room. This pauses the shard's websocket reader. (default)"""
+
+    DROP_OLDEST = 'drop_oldest'
+    """Drop the oldest queued event of an overflow type. Blocks if none is queued."""
+
+    COALESCE = 'coalesce'
+    """Replace a queued event about the same entity with the newer one. Blocks if none is queued."""
+
+def coalesce_key(dispatch_type: str, data: dict):
+    """Default key for coalescing events: dispatch type + guild + entity ID.
+
+    Args:
+        dispatch_type (str): dispatch name of the event
+        data (dict): raw event payload
+
+    Returns:
+        (tuple | None): key, or None if the event does not name a single entity
+    """
+    if not isinstance(data, dict):
+        return None
+
+    entity_id = data.get('id') or (data.get('user') or {}).get('id')
+    if entity_id is None:
+        return None
+
+    return (dispatch_type, data.get('guild_id'), entity_id)
+
+class EventQueue:
+    """FIFO of `(dispatch_type, event_data)` between a shard's reader and its dispatcher.
+        Optionally bounded, with a selectable overflow policy and depth metrics.
+    """
+
+    def __init__(self,
+        maxsize: int = 0,
+        overflow_policy: str = OverflowPolicies.BLOCK,
+        overflow_types: set[str] = None,
+        coalesce_key = coalesce_key
+    ):
+        """
+        Args:
+            maxsize (int, optional): max queued events. `0` means unbounded. Defaults to 0.
+            overflow_policy (str, optional): what to do when full.
+                See [`OverflowPolicies`][scurrypy.core.event_queue.OverflowPolicies]. Defaults to `OverflowPolicies.BLOCK`.
+            overflow_types (set[str], optional): event names the policy may drop or coalesce.
+                `None` means any event. Defaults to None.
+            coalesce_key (callable, optional): maps `(dispatch_type, event_data)` to a key for `COALESCE`.
+        """
+        if overflow_policy not in (OverflowPolicies.BLOCK, OverflowPolicies.DROP_OLDEST, OverflowPolicies.COALESCE):
+            raise ValueError(f"Invalid overflow policy: {overflow_policy}")
+
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.overflow_types = overflow_types
+        self.coalesce_key = coalesce_key
+
+        self._items = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+        self.high_water = 0
+        """Most events queued at once."""
+
+        self.blocked = 0
+        """Number of puts that had to wait for room."""
+
+        self.dropped: dict[str, int] = {}
+        """Count of dropped events per event name."""
+
+        self.coalesced: dict[str, int] = {}
+        """Count of events merged into a queued event per event name."""
+
+    def qsize(self):
+        """Number of queued events."""
+        return len(self._items)
+
+    def full(self):
+        """Whether the queue is at `maxsize`."""
+        return 0 < self.maxsize <= len(self._items)
+
+    def metrics(self):
+        """Snapshot of this queue's metrics.
+
+        Returns:
+            (dict): depth, high-water mark, and overflow counters
+        """
+        return {
+            'depth': len(self._items),
+            'high_water': self.high_water,
+            'maxsize': self.maxsize,
+            'blocked': self.blocked,
+            'dropped': dict(self.dropped),
+            'coalesced': dict(self.coalesced)
+        }
+
+    async def put(self, item: tuple[str, dict]):
+        """Queue an event, applying the overflow policy if the queue is full.
+
+        Args:
+            item (tuple[str, dict]): `(dispatch_type, event_data)`
+        """
+        waited = False
+
+        while self.full():
+            if self.overflow_policy == OverflowPolicies.DROP_OLDEST and self._drop_oldest():
+                break
+
+            if self.overflow_policy == OverflowPolicies.COALESCE and self._coalesce(item):
+                return
+
+            if not waited:
+                waited = True
+                self.blocked += 1
+                logger.debug(f"Event queue full ({self.maxsize}). Waiting for room...")
+
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        self._items.append(item)
+        self.high_water = max(self.high_water, len(self._items))
+        self._not_empty.set()
+
+    async def get(self):
+        """Remove and return the next event, waiting if the queue is empty.
+
+        Returns:
+            (tuple[str, dict]): `(dispatch_type, event_data)`
+        """
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        item = self._items.popleft()
+        self._not_full.set()
+
+        return item
+
+    def _can_overflow(self, dispatch_type: str):
+        """Whether the policy may drop or coalesce this event type."""
+        return self.overflow_types is None or dispatch_type in self.overflow_types
+
+    def _drop_oldest(self):
+        """Drop the oldest queued event of an overflow type.
+
+        Returns:
+            (bool): if an event was dropped
+        """
+        for idx, (dispatch_type, _) in enumerate(self._items):
+            if self._can_overflow(dispatch_type):
+                del self._items[idx]
+                self.dropped[dispatch_type] = self.dropped.get(dispatch_type, 0) + 1
+                return True
+
+        return False
+
+    def _coalesce(self, item: tuple[str, dict]):
+        """Replace a queued event about the same entity with `item`.
+
+        Args:
+            item (tuple[str, dict]): the incoming event
+
+        Returns:
+            (bool): if `item` was merged into the queue
+        """
+        dispatch_type, data = item
+
+        if not self._can_overflow(dispatch_type):
+            return False
+
+        key = self.coalesce_key(dispatch_type, data)
+        if key is None:
+            return False
+
+        for idx, (queued_type, queued_data) in enumerate(self._items):
+            if queued_type == dispatch_type and self.coalesce_key(queued_type, queued_data) == key:
+                self._items[idx] = item
+                self.coalesced[dispatch_type] = self.coalesced.get(dispatch_type, 0) + 1
+                return True
+
+        return False
@@ -1,6 +1,16 @@
 import asyncio
-import json
+import itertools
+import time
+import zlib
 import websockets
+from collections import deque
+
+from .event_queue import EventQueue
+from .codec import JSONCodec
+from .etf import ETFCodec
+from .identify import IdentifyScheduler
+from .session_store import SessionState, SessionStore
+from .member_chunks import MemberChunks
 
 import logging
 
@@ -8,15 +18,52 @@ logger = logging.getLogger(__name__)
 
 MIN_BACKOFF = 5
 
+RESUMABLE_CLOSE_CODE = 4000
+"""Close code that keeps the session alive for RESUME. Codes 1000 and 1001 end the session."""
+
+ZLIB_SUFFIX = b'\x00\x00\xff\xff'
+"""Z_SYNC_FLUSH marker ending every complete zlib-stream message."""
+
+MEMBER_REQUESTS_PER_MINUTE = 100
+"""Op 8 requests sent per shard per minute. Discord allows 120 gateway commands a minute; 
+    the rest is left for heartbeats and other commands.
+"""
+
 class GatewayClient:
-    def __init__(self, gateway_url: str, shard_id: int, total_shards: int):
+    def __init__(self, 
+        gateway_url: str, 
+        shard_id: int, 
+        total_shards: int, 
+        event_queue: EventQueue = None, 
+        compress: bool = False,
+        codec: JSONCodec = None,
+        encoding: str = 'json',
+        identify_scheduler: IdentifyScheduler = None,
+        session_store: SessionStore = None,
+        session_start = None
+    ):
         """Initialize this websocket.
 
         Args:
             gateway_url (str): gateway URL provided by GET /gateway/bot endpoint
             shard_id (int): assigned shard ID
             total_shards (int): total shard count provided by GET /gateway/bot endpoint
+            event_queue (EventQueue, optional): queue for dispatched events. Defaults to an unbounded queue.
+            compress (bool, optional): use `zlib-stream` transport compression. Defaults to False.
+            codec (JSONCodec, optional): JSON codec for frames. Defaults to the stdlib codec.
+            encoding (str, optional): gateway payload encoding, `json` or `etf`. Defaults to `json`.
+            identify_scheduler (IdentifyScheduler, optional): paces every IDENTIFY, including re-identifies.
+                Defaults to None (no pacing).
+            session_store (SessionStore, optional): kept current with this shard's session. Defaults to None.
+            session_start (callable, optional): `async () -> None` that takes a session start from the budget, 
+                awaited when a restored session falls back to IDENTIFY. Defaults to None.
+
+        Raises:
+            (ValueError): invalid encoding
         """
+        if encoding not in ('json', 'etf'):
+            raise ValueError(f"Invalid gateway encoding: {encoding}")
+        
         self.shard_id = shard_id
         self.total_shards = total_shards
         self.ws = None
@@ -26,10 +73,34 @@ class GatewayClient:
         self.backoff = MIN_BACKOFF
         self.heartbeat_task = None
         self.heartbeat_interval = None
-        self.event_queue = asyncio.Queue()
+        self.event_queue = event_queue or EventQueue()
+        self.identify_scheduler = identify_scheduler
+
+        # a restored session skipped the session start budget; pay for it if it falls back to IDENTIFY
+        self.session_store = session_store
+        self.session_start = session_start
+        self.restored = False
+
+        # op 8 requests waiting to be sent, and sent ones waiting on chunks, by nonce
+        self.ready = False
+        self.nonces = itertools.count()
+        self.member_requests: dict[str, MemberChunks] = {}
+        self.member_request_queue: asyncio.Queue[MemberChunks] = asyncio.Queue()
+        self.member_request_times = deque()
+        self.member_request_task = None
+
+        # ETF frames are binary and carry snowflakes as ints
+        self.encoding = encoding
+        self.codec = ETFCodec() if encoding == 'etf' else (codec or JSONCodec())
+        self.compress = compress
+        self.inflator = None
+        self.buffer = bytearray()
 
         self.base_url = gateway_url
-        self.url_params = "?v=10&encoding=json"
+        self.url_params = f"?v=10&encoding={encoding}"
+
+        if compress:
+            self.url_params += "&compress=zlib-stream"
 
     async def wait_reconnect(self):
         """Sleep for exponentially increasing time between reconnects."""
@@ -54,6 +125,15 @@ class GatewayClient:
                     logger.debug(f"SHARD ID {self.shard_id}: Attempting to resume...")
                     await self.resume(token)
                 else:
+                    if self.restored:
+                        self.restored = False
+                        if self.session_start:
+                            await self.session_start()
+
+                    # initial identify and every re-identify after a reconnect share the same buckets
+                    if self.identify_scheduler:
+                        await self.identify_scheduler.acquire(self.shard_id)
+
                     logger.debug(f"SHARD ID {self.shard_id}: Attempting to identify...")
                     await self.identify(token, intents)
 
@@ -79,6 +159,11 @@ class GatewayClient:
     async def connect_ws(self):
         """Connect to Discord's Gateway (websocket)."""
 
+        # the zlib context spans the whole connection, so start fresh
+        if self.compress:
+            self.inflator = zlib.decompressobj()
+            self.buffer.clear()
+
         # connect to websocket
         self.ws = await websockets.connect(self.base_url + self.url_params)
         logger.info(f"SHARD ID {self.shard_id}: Connected to Discord!")
@@ -98,7 +183,13 @@ class GatewayClient:
         Args:
             data (dict): data to send
         """
-        await self.ws.send(json.dumps(data))
+        payload = self.codec.encode(data)
+
+        # JSON goes out as a text frame, ETF as a binary frame
+        if self.encoding == 'json':
+            payload = payload.decode()
+
+        await self.ws.send(payload)
 
     async def receive(self):
         """Receive data through the websocket.
@@ -106,7 +197,25 @@ class GatewayClient:
         Returns:
             (dict): websocket data
         """
-        return json.loads(await self.ws.recv())
+        if not self.compress:
+            return self.codec.decode(await self.ws.recv())
+        
+        # a message may span several frames; inflate once the flush suffix arrives
+        while True:
+            frame = await self.ws.recv()
+
+            if isinstance(frame, str):
+                return self.codec.decode(frame)
+
+            self.buffer.extend(frame)
+
+            if self.buffer[-4:] != ZLIB_SUFFIX:
+                continue
+
+            data = self.inflator.decompress(self.buffer)
+            self.buffer.clear()
+
+            return self.codec.decode(data)
 
     async def heartbeat(self):
         """Heartbeat task to keep connection alive."""
@@ -167,6 +276,125 @@ class GatewayClient:
         })
         logger.info(f"SHARD ID {self.shard_id}: Resume Sent.")
 
+    def request_guild_members(self, 
+        guild_id: int, 
+        *, 
+        query: str = '', 
+        limit: int = 0, 
+        user_ids: list[int] = None, 
+        presences: bool = False,
+        timeout: float = 30
+    ):
+        """Queue an op 8 REQUEST_GUILD_MEMBERS for a guild on this shard.
+            Requests are sent in order once the shard is ready, paced under the gateway's rate limit.
+
+        !!! note
+            Listing every member (empty `query`, `limit` 0) needs the `GUILD_MEMBERS` intent.
+
+        Args:
+            guild_id (int): ID of the guild
+            query (str, optional): only members whose username starts with this. Defaults to '' (all).
+            limit (int, optional): max members to return. `0` means no limit. Defaults to 0.
+            user_ids (list[int], optional): fetch these users instead of matching `query`. Defaults to None.
+            presences (bool, optional): include members' presences. Defaults to False.
+            timeout (float, optional): seconds to wait for each chunk, counted from when the request is sent, 
+                before it fails. Defaults to 30.
+
+        Returns:
+            (MemberChunks): the request, to iterate or await for its members
+        """
+        nonce = f"{self.shard_id}-{next(self.nonces)}"
+
+        payload = {'guild_id': guild_id, 'limit': limit, 'presences': presences, 'nonce': nonce}
+
+        if user_ids:
+            payload['user_ids'] = user_ids
+        else:
+            payload['query'] = query
+
+        request = MemberChunks(guild_id, nonce, payload, timeout=timeout, on_timeout=self._drop_member_request)
+
+        self.member_requests[nonce] = request
+        self.member_request_queue.put_nowait(request)
+        self._start_member_requests()
+
+        return request
+
+    def _start_member_requests(self):
+        """Start sending queued member requests if the shard is ready and nothing is sending them."""
+
+        if not self.ready or self.member_request_queue.empty():
+            return
+        
+        if self.member_request_task and not self.member_request_task.done():
+            return
+
+        self.member_request_task = asyncio.create_task(self._send_member_requests())
+
+    def _drop_member_request(self, request: MemberChunks):
+        """Forget a timed out member request. Late chunks for its nonce are ignored.
+
+        Args:
+            request (MemberChunks): the request
+        """
+        self.member_requests.pop(request.nonce, None)
+
+    def _retry_member_request(self, request: MemberChunks):
+        """Queue a rate limited member request again.
+
+        Args:
+            request (MemberChunks): the request
+        """
+        self.member_request_queue.put_nowait(request)
+        self._start_member_requests()
+
+    async def _send_member_requests(self):
+        """Send queued member requests until the queue is empty, at most `MEMBER_REQUESTS_PER_MINUTE` a minute."""
+
+        times = self.member_request_times
+
+        while not self.member_request_queue.empty():
+            request = self.member_request_queue.get_nowait()
+
+            if request.done:
+                continue
+
+            try:
+                while len(times) >= MEMBER_REQUESTS_PER_MINUTE:
+                    wait = times[0] + 60 - time.monotonic()
+                    if wait <= 0:
+                        times.popleft()
+                    else:
+                        await asyncio.sleep(wait)
+
+                await self.send({'op': 8, 'd': request.payload})
+
+                request.sent = True
+                request.arm()
+                times.append(time.monotonic())
+
+                logger.debug(f"SHARD ID {self.shard_id}: Requested members of guild {request.guild_id}")
+
+            except websockets.exceptions.ConnectionClosed:
+                # the listener reconnects; sending resumes once the shard is ready again
+                return
+
+            finally:
+                # cancelled or disconnected mid-send: keep it for the next session
+                if not request.sent:
+                    self.member_request_queue.put_nowait(request)
+
+    def _fail_member_requests(self, error: Exception):
+        """Fail every sent request still waiting on chunks. Unsent requests are kept.
+
+        Args:
+            error (Exception): error to raise to waiters
+        """
+        for nonce, request in list(self.member_requests.items()):
+            if request.sent:
+                request.fail(error)
+                del self.member_requests[nonce]
+
     async def _listen(self):
         """Listen for events and queue them to be consumed by Client.
 
@@ -190,10 +418,39 @@ class GatewayClient:
                         self.session_id = event_data.get("session_id")
                         self.base_url = event_data.get("resume_gateway_url", self.base_url)
                         self.backoff = MIN_BACKOFF
+
+                        # a new session won't deliver chunks for requests sent in the old one
+                        self._fail_member_requests(ConnectionError("Session ended before every member chunk arrived."))
+
+                        self.ready = True
+                        self._start_member_requests()
+
+                        # replace a stale saved session now, not only on a clean shutdown
+                        await self._store_session()
                         
                     elif dispatcher_type == "RESUMED":
+                        self.restored = False
                         self.backoff = MIN_BACKOFF
 
+                        self.ready = True
+                        self._start_member_requests()
+
+                    elif dispatcher_type == "GUILD_MEMBERS_CHUNK":
+                        request = self.member_requests.get(event_data.get('nonce'))
+                        if request:
+                            request.feed(event_data)
+                            if request.done:
+                                del self.member_requests[request.nonce]
+
+                    elif dispatcher_type == "RATE_LIMITED":
+                        request = self.member_requests.get((event_data.get('meta') or {}).get('nonce'))
+                        if request and event_data.get('opcode') == 8:
+                            retry_after = event_data.get('retry_after', 1)
+                            logger.warning(f"SHARD ID {self.shard_id}: Member request rate limited, retrying in {retry_after}s")
+                            request.sent = False
+                            request.disarm()
+                            asyncio.get_running_loop().call_later(retry_after, self._retry_member_request, request)
+
                     await self.event_queue.put((dispatcher_type, event_data))
 
                 case 7:  # RECONNECT
@@ -212,15 +469,69 @@ class GatewayClient:
                         self.session_id = self.seq = None
                         logger.debug(f"SHARD ID {self.shard_id}: Invalid session (not resumable).")
 
+                        # don't try the dead session again on the next boot
+                        await self._store_session()
+
                     raise ConnectionError("Invalid session.")
 
                 case 11:  # HEARTBEAT_ACK
                     logger.debug(f"SHARD ID {self.shard_id}: Heartbeat ACK")
 
-    async def close_ws(self):
-        """Close the websocket connection if one is still open and cancels heartbeat."""
+    def session_state(self):
+        """Snapshot of this shard's session for RESUME.
+
+        Returns:
+            (SessionState | None): current session or None if there is nothing to resume
+        """
+        if not self.session_id or self.seq is None:
+            return None
+
+        return SessionState(self.session_id, self.seq, self.base_url)
+
+    def restore_session(self, state: SessionState):
+        """Resume a saved session on the next connect instead of identifying.
+            If Discord rejects it, the shard falls back to IDENTIFY and spends a session start then.
+
+        Args:
+            state (SessionState): saved session
+        """
+        self.session_id = state.session_id
+        self.seq = state.seq
+        self.base_url = state.resume_gateway_url
+        self.allow_resume = True
+        self.restored = True
+
+    async def _store_session(self):
+        """Save the current session to the session store, or delete it once there is none."""
+
+        if not self.session_store:
+            return
+
+        state = self.session_state()
+
+        try:
+            if state:
+                await self.session_store.save(self.shard_id, self.total_shards, state)
+            else:
+                await self.session_store.delete(self.shard_id, self.total_shards)
+        except Exception:
+            logger.exception(f"SHARD ID {self.shard_id}: Could not update saved session")
+
+    async def close_ws(self, code: int = 1000):
+        """Close the websocket connection if one is still open and cancels heartbeat.
+
+        Args:
+            code (int, optional): close code. `RESUMABLE_CLOSE_CODE` keeps the session resumable. Defaults to 1000.
+        """
 
         logger.info(f"Shard ID {self.shard_id}: Closing connection...")
+
+        # unsent member requests go back on the queue and resume once the shard is ready again
+        self.ready = False
+        if self.member_request_task:
+            self.member_request_task.cancel()
+            self.member_request_task = None
+
         if self.ws:
             if self.heartbeat_task:
                 self.heartbeat_task.cancel()
@@ -229,6 +540,6 @@ class GatewayClient:
                 except asyncio.CancelledError:
                     pass
                 self.heartbeat_task = None
-            await self.ws.close()
+            await self.ws.close(code)
 
         self.ws = None
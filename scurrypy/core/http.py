@@ -1,35 +1,129 @@
 """
 R = request
 EP = endpoint
+RK = route key (method + route template + major parameters)
 L = Lock
 Q = Queue
 H = header
 B = Bucket
 A + B = {A:B}
 
-[R + EP]--|L|-->[Q + EP]--|send R|-->[add/update H + B]
-    1. request by endpoint
+[R + EP]--|RK|--|L|-->[Q + RK]--|reserve B|-->[send R]-->[add/update H + B]
+    1. request by endpoint, keyed by route
     2. push request to queue with lock
-    3. add/update header by bucket ID with send request
+    3. reserve a slot in the route's bucket (once known)
+    4. send request, add/update header by bucket ID
 
-    * Queue by ENDPOINT/REQUEST
-    * Bucket by HEADER
+    * Queue by ROUTE KEY
+    * Bucket by HEADER, mapped onto route keys
+    * Up to B.remaining requests of a bucket are in flight at once
 """
 
 import asyncio
+import heapq
+import itertools
+import random
+import time
 import aiohttp
-import aiofiles
-import json
 from typing import Any
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .error import DiscordError
+from .codec import JSONCodec
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+MAJOR_PARAMETERS = {
+    'channels': 1,
+    'guilds': 1,
+    'webhooks': 2,
+    'interactions': 2
+}
+"""Maps top-level resource -> number of leading path parameters that are major (kept in the route key)."""
+
+def route_key(method: str, endpoint: str):
+    """Reduce an endpoint to the route it is rate limited by.
+        Minor IDs become `{id}` and reaction emojis become `{emoji}`,
+        so `/channels/1/messages/2/reactions/a:3/@me` and `/channels/1/messages/4/reactions/b:5/@me` share a key.
+
+    Args:
+        method (str): HTTP method
+        endpoint (str): Discord endpoint
+
+    Returns:
+        (str): route key
+    """
+    parts = endpoint.strip('/').split('/')
+    major = MAJOR_PARAMETERS.get(parts[0], 0)
+
+    for i in range(major + 1, len(parts)):
+        if parts[i - 1] == 'reactions':
+            parts[i] = '{emoji}'
+        elif parts[i].isdigit():
+            parts[i] = '{id}'
+
+    return f"{method} /{'/'.join(parts)}"
+
+def major_key(route: str):
+    """Major parameters of a route key. Discord limits a bucket separately for each of them,
+        so `POST /channels/1/messages` and `POST /channels/2/messages` share a bucket hash but not its budget.
+
+    Args:
+        route (str): route key from [`route_key`][scurrypy.core.http.route_key]
+
+    Returns:
+        (str): major parameters joined by `/`, empty for top-level routes
+    """
+    parts = route.split(' ', 1)[1].strip('/').split('/')
+
+    return '/'.join(parts[1:MAJOR_PARAMETERS.get(parts[0], 0) + 1])
+
+RETRY_STATUSES = (500, 502, 503, 504)
+"""Server errors worth retrying."""
+
+GLOBAL_EXEMPT_PREFIX = 'interactions/'
+"""Interaction callbacks are not bound by the global rate limit."""
+
+INTERACTION_DEADLINE = 3.0
+"""Seconds Discord allows between an interaction and its callback."""
+
+DISCORD_EPOCH = 1420070400000
+"""First second of 2015 in ms. Snowflakes count from here."""
+
+class RequestPriorities:
+    """Priority classes for HTTP requests. Lower goes first for global rate limit tokens and gets its own connection pool."""
+
+    INTERACTION = 0
+    """Interaction callbacks (`/interactions/{id}/{token}/callback`). Bound by a 3 second deadline."""
+
+    FOLLOWUP = 1
+    """Webhook routes with a token, used by interaction followups and `@original` edits."""
+
+    DEFAULT = 2
+    """Everything else."""
+
+def request_priority(endpoint: str):
+    """Pick the priority class of an endpoint.
+
+    Args:
+        endpoint (str): Discord endpoint
+
+    Returns:
+        (int): see [`RequestPriorities`][scurrypy.core.http.RequestPriorities]
+    """
+    parts = endpoint.strip('/').split('/')
+
+    if parts[0] == 'interactions':
+        return RequestPriorities.INTERACTION
+
+    if parts[0] == 'webhooks' and len(parts) > 2:
+        return RequestPriorities.FOLLOWUP
+    
+    return RequestPriorities.DEFAULT
+
 @dataclass
 class RequestItem:
     method: str
@@ -38,40 +132,127 @@ class RequestItem:
     params: dict = None
     files: dict = None
     future: asyncio.Future = None
+    route: str = None
+    priority: int = RequestPriorities.DEFAULT
 
 @dataclass
 class Bucket:
     remaining: int
     reset_after: float
     reset_on: float
-    sleep_task: asyncio.Task = None
+    limit: int = 1
+    reset_at: float = 0.0 # loop time the window resets
+    in_flight: int = 0 # requests sent but not answered
+    released: asyncio.Condition = field(default_factory=asyncio.Condition) # notified when a request is answered
+
+class GlobalRateLimiter:
+    """Keeps requests to at most `rate` per `period` seconds, as Discord receives them.
+        A request holds one of `rate` tokens from before it is sent until `period` seconds after its answer.
+        Discord receives it somewhere in between, so requests sharing a token arrive over `period` apart whatever the latency.
+        Freed tokens go to the waiter with the best priority, then the earliest.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0):
+        """
+        Args:
+            rate (int): max requests per period
+            period (float, optional): window in seconds. Defaults to 1.0.
+        """
+        self.rate = rate
+        self.period = period
+        self.tokens = rate
+
+        self.waiters: list[tuple[int, int, asyncio.Future]] = []
+        """Heap of `(priority, arrival, future)` waiting for a token."""
+
+        self.arrivals = itertools.count()
+
+    async def acquire(self, priority: int = RequestPriorities.DEFAULT):
+        """Wait for a free token.
+
+        Args:
+            priority (int, optional): see [`RequestPriorities`][scurrypy.core.http.RequestPriorities].
+                Defaults to `RequestPriorities.DEFAULT`.
+        """
+        if self.tokens > 0 and not self.waiters:
+            self.tokens -= 1
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.arrivals), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the token was handed over as we were cancelled; pass it on
+                self._free()
+            raise
+
+    def release(self):
+        """Give the token back `period` seconds from now. Call once the request is answered or failed."""
+
+        asyncio.get_running_loop().call_later(self.period, self._free)
+
+    def _free(self):
+        """Hand a token to the best waiter, or put it back."""
+
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+            
+        self.tokens += 1
 
 class HTTPClient:
     BASE = "https://discord.com/api/v10"
-    MAX_RETRIES = 3
+    MAX_RETRIES = 3 # retries per request after a 429, 5xx, or connection reset
+    IDLE_TIMEOUT = 60 # seconds a route's worker and bucket are kept without requests
 
-    def __init__(self):
+    def __init__(self, codec: JSONCodec = None, global_rate_limit: int = 50):
+        """
+        Args:
+            codec (JSONCodec, optional): JSON codec for request and response bodies. Defaults to the stdlib codec.
+            global_rate_limit (int, optional): max requests per second across all routes, 
+                except interaction callbacks. Defaults to 50.
+        """
         self.session = None
+        self.priority_session = None # own connection pool for interaction traffic
+        self.codec = codec or JSONCodec()
+        self.global_limiter = GlobalRateLimiter(global_rate_limit)
 
         # PRE-REQUEST
-        self.queues: dict[str, asyncio.Queue] = {}  # maps EP -> Q
+        self.queues: dict[str, asyncio.Queue] = {}  # maps RK -> Q
         self.queues_lock = asyncio.Lock() # locks queues dict for editing
 
-        self.workers: dict[str, asyncio.Task] = {}  # maps EP -> worker
+        self.workers: dict[str, asyncio.Task] = {}  # maps RK -> worker
+        self.tasks: set[asyncio.Task] = set() # requests in flight (keeps strong references)
 
         # POST-REQUEST
-        self.buckets: dict[str, Bucket] = {}  # maps B -> Bucket
-        self.bucket_lock: dict[str, asyncio.Lock] = {} # maps B to Lock
-        self.buckets_lock = asyncio.Lock() # locks buckets dict for editing
+        self.buckets: dict[str, Bucket] = {}  # maps B:major -> Bucket
+        self.route_buckets: dict[str, str] = {} # maps RK -> B:major (learned from headers)
 
         self.global_lock = asyncio.Lock()
         self.global_reset = 0.0
 
+        self.last_sweep = 0.0 # loop time buckets were last swept
+
+        self.retries = {'rate_limit': 0, 'server_error': 0, 'connection': 0} # retries by cause
+        self.exhausted = 0 # requests that failed after MAX_RETRIES
+        self.missed_deadlines = 0 # interaction callbacks answered after INTERACTION_DEADLINE
+
+        self.pending_gets: dict[tuple, asyncio.Future] = {} # maps (EP, params) -> promise of the GET in flight
+        self.coalesced_gets = 0 # GETs answered by another caller's request
+
     async def start(self, token: str):
         """Start the HTTP session."""
 
         if not self.session:
             self.session = aiohttp.ClientSession(headers={"Authorization": f"Bot {token}"})
+
+            # background traffic can't take the connections interaction responses need
+            self.priority_session = aiohttp.ClientSession(headers={"Authorization": f"Bot {token}"})
             logger.info("HTTP session started.")
         else:
             logger.warning("HTTP session already initialized.")
@@ -79,8 +260,9 @@ class HTTPClient:
     async def close(self):
         """Gracefully stop all workers and close the HTTP session."""
 
-        if self.session: # just the session that needs to close!
+        if self.session: # just the sessions that need to close!
             await self.session.close()
+            await self.priority_session.close()
             logger.info("Session closed.")
 
     async def request(
@@ -91,8 +273,10 @@ class HTTPClient:
         data: dict | None = None,
         params: dict | None = None,
         files: Any | None = None,
+        priority: int | None = None,
+        raise_errors: bool = False
     ):
-        """Queue a request for the given endpoint.
+        """Queue a request for the given endpoint. Requests are queued by route key; see `route_key`.
 
         Args:
             method (str): HTTP method (e.g., POST, GET, DELETE, PATCH, etc.)
@@ -100,20 +284,19 @@ class HTTPClient:
             data (dict | None, optional): relevant data
             params (dict | None, optional): relevant query params
             files (Any | None, optional): relevant files
+            priority (int | None, optional): see [`RequestPriorities`][scurrypy.core.http.RequestPriorities].
+                Defaults to the endpoint's class (`request_priority`).
+            raise_errors (bool, optional): raise `DiscordError` instead of logging it and returning None. Defaults to False.
+
+        Raises:
+            (DiscordError): Discord rejected the request, if `raise_errors` is set
 
         Returns:
             (Future | None): result or promise of request or None if failed
-        """
-        # ensure a queue is in place for the requested endpoint
-        async with self.queues_lock:
-            queue = self.queues.setdefault(endpoint, asyncio.Queue())
-
-        if endpoint not in self.workers:
-            self.workers[endpoint] = asyncio.create_task(self._worker(endpoint))
-
-        # set promise
-        future = asyncio.get_event_loop().create_future()
 
+        !!! note
+            Identical GETs (same endpoint and params) in flight at the same time share one request and its result.
+        """
         def sanitize_query_params(params: dict | None) -> dict | None:
             """Sanitize a request's params for session.request
 
@@ -128,61 +311,261 @@ class HTTPClient:
             return {k: ('true' if v is True else 'false' if v is False else v)
                 for k, v in params.items() if v is not None}
 
-        await queue.put(RequestItem(method, endpoint, data, sanitize_query_params(params), files, future))
+        params = sanitize_query_params(params)
+
+        get_key = None
+        if method == 'GET':
+            get_key = (endpoint.strip('/'), tuple(sorted(params.items())) if params else None)
+            future = self.pending_gets.get(get_key)
+
+            if future:
+                self.coalesced_gets += 1
+                return await self._wait(future, raise_errors)
+
+        route = route_key(method, endpoint)
+
+        # ensure a queue is in place for the requested route
+        async with self.queues_lock:
+            queue = self.queues.setdefault(route, asyncio.Queue())
+
+        if route not in self.workers:
+            self.workers[route] = asyncio.create_task(self._worker(route))
+
+        # set promise
+        future = asyncio.get_event_loop().create_future()
+
+        if get_key:
+            self.pending_gets[get_key] = future
+            future.add_done_callback(lambda _: self.pending_gets.pop(get_key, None))
+
+        if priority is None:
+            priority = request_priority(endpoint)
+
+        await queue.put(RequestItem(method, endpoint, data, params, files, future, route, priority))
+
+        return await self._wait(future, raise_errors)
+    
+    async def _wait(self, future: asyncio.Future, raise_errors: bool = False):
+        """Wait for a request's result.
+
+        Args:
+            future (asyncio.Future): promise of the request
+            raise_errors (bool, optional): re-raise `DiscordError` instead of returning None. Defaults to False.
 
-        # return promise
+        Returns:
+            (dict | str | None): result of the request or None if failed
+        """
+        # shielded: one caller giving up must not cancel a request others share
         try:
-            return await future
+            return await asyncio.shield(future)
         except DiscordError as e:
+            if raise_errors:
+                raise
             logger.error(e)
             return None
 
-    async def _worker(self, endpoint: str):
-        """Background worker that processes requests for this endpoint.
+    async def _worker(self, route: str):
+        """Background worker that processes requests for this route.
+            Once the route's bucket is known, requests run concurrently up to the bucket's remaining count.
+            Until then, they run one at a time.
 
         Args:
-            endpoint (str): the endpoint to receive requests
+            route (str): the route key to receive requests
         """
-        # fetch the queue by endpoint
-        queue = self.queues[endpoint]
+        # fetch the queue by route
+        queue = self.queues[route]
 
         while True:
             # get the next item in the queue
-            item: RequestItem = await queue.get()
+            try:
+                item: RequestItem = await asyncio.wait_for(queue.get(), self.IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    self._evict_route(route)
+                    break
+                continue
 
             if item is None: # sentinel = time to stop
                 queue.task_done()
                 break
 
-            try:
-                result = await self._send(item)
-            except Exception as e:
-                item.future.set_exception(e)
-            else:
-                item.future.set_result(result)
-            finally:
-                queue.task_done()
+            bucket = self.buckets.get(self.route_buckets.get(route))
+
+            if not bucket:
+                # bucket unknown: the response tells us its limits
+                await self._run(item, queue, None)
+                continue
+
+            await self._reserve(route, bucket)
+
+            task = asyncio.create_task(self._run(item, queue, bucket))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    def _evict_route(self, route: str):
+        """Forget an idle route's queue and worker, and sweep expired buckets.
+            Runs without awaiting, so no request can be queued to the route halfway through.
+
+        Args:
+            route (str): the idle route key
+        """
+        del self.queues[route]
+        del self.workers[route]
+        self.route_buckets.pop(route, None)
+
+        now = asyncio.get_running_loop().time()
+
+        # sweeping scans every bucket; do it at most once per timeout
+        if now - self.last_sweep < self.IDLE_TIMEOUT:
+            return
+
+        self.last_sweep = now
+
+        expired = [
+            bucket_id for bucket_id, bucket in self.buckets.items()
+            if not bucket.in_flight and bucket.reset_at + self.IDLE_TIMEOUT < now
+        ]
+
+        for bucket_id in expired:
+            del self.buckets[bucket_id]
 
-    async def _sleep_endpoint(self, endpoint: str, bucket: Bucket):
-        """Let an endpoint sleep for the designated reset_after seconds.
+        logger.debug(f"Evicted route {route} and {len(expired)} expired buckets")
+
+    async def _run(self, item: RequestItem, queue: asyncio.Queue, bucket: Bucket | None):
+        """Send a request and settle its future.
 
         Args:
-            endpoint (str): endpoint to sleep
-            bucket (Bucket): endpoint's bucket info
+            item (RequestItem): the request object
+            queue (asyncio.Queue): queue the request came from
+            bucket (Bucket | None): bucket the request holds a slot in, if any
         """
-        logger.warning(f"Bucket {endpoint} rate limit is active. Sleeping for {bucket.reset_after}s...")
-        await asyncio.sleep(bucket.reset_after)
-        bucket.sleep_task = None
-        logger.info(f"Bucket {endpoint} reset after {bucket.reset_after}s")
+        try:
+            result = await self._send(item, bucket)
+        except Exception as e:
+            item.future.set_exception(e)
+        else:
+            item.future.set_result(result)
+        finally:
+            queue.task_done()
+
+            if bucket:
+                bucket.in_flight -= 1
+                async with bucket.released:
+                    bucket.released.notify_all()
+
+    async def _reserve(self, route: str, bucket: Bucket):
+        """Wait for a free slot in the bucket and claim it.
+
+        Args:
+            route (str): route key of the request
+            bucket (Bucket): route's bucket info
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            now = loop.time()
+
+            if bucket.remaining <= 0 and bucket.reset_at <= now:
+                # window is over; requests still in flight may land in the new one
+                bucket.remaining = bucket.limit - bucket.in_flight
+
+            if bucket.remaining > 0:
+                bucket.remaining -= 1
+                bucket.in_flight += 1
+                return
+
+            if bucket.reset_at > now:
+                logger.warning(f"Bucket {route} rate limit is active. Sleeping for {bucket.reset_at - now:.2f}s...")
+                await asyncio.sleep(bucket.reset_at - now)
+            else:
+                # every slot is in flight: wait for an answer
+                async with bucket.released:
+                    await bucket.released.wait()
+
+    def metrics(self):
+        """Snapshot of this client's metrics.
+
+        Returns:
+            (dict): retries by cause, requests that ran out of retries, late interaction callbacks, and coalesced GETs
+        """
+        return {
+            'retries': dict(self.retries),
+            'exhausted': self.exhausted,
+            'missed_deadlines': self.missed_deadlines,
+            'coalesced_gets': self.coalesced_gets
+        }
 
     async def _check_global_rate_limit(self):
         """Checks if the global rate limit is after now (active)."""
-        now = asyncio.get_event_loop().time()
-        if self.global_reset > now:
+        loop = asyncio.get_event_loop()
+        if self.global_reset > loop.time():
             async with self.global_lock:
-                logger.warning(f"Global reset is active. Sleeping for {self.global_reset - now}s...")
-                await asyncio.sleep(self.global_reset - now)
-                logger.info(f"Global has reset after {self.global_reset - now}s...")
+                # re-check: whoever held the lock may have waited it out already
+                delay = self.global_reset - loop.time()
+                if delay > 0:
+                    logger.warning(f"Global reset is active. Sleeping for {delay:.2f}s...")
+                    await asyncio.sleep(delay)
+                    logger.info(f"Global has reset after {delay:.2f}s...")
+
+    async def _retry_after(self, resp: aiohttp.ClientResponse):
+        """Read how long to wait after a 429, and start the global wait if it is global.
+
+        Args:
+            resp (aiohttp.ClientResponse): the 429 response
+
+        Returns:
+            (float): seconds to wait
+        """
+        body = await self._read_body(resp)
+
+        if isinstance(body, dict) and 'retry_after' in body:
+            retry_after = float(body['retry_after'])
+        else:
+            retry_after = float(resp.headers.get('Retry-After', 1))
+
+        scope = resp.headers.get('x-ratelimit-scope', 'user')
+
+        if scope == 'global' or (isinstance(body, dict) and body.get('global')):
+            self.global_reset = max(self.global_reset, asyncio.get_event_loop().time() + retry_after)
+
+        logger.warning(f"Rate limited ({scope}) on {resp.method} {resp.url.path}. Retrying in {retry_after:.2f}s...")
+
+        return retry_after
+
+    def _check_deadline(self, item: RequestItem):
+        """Log an interaction callback answered after Discord's deadline.
+
+        Args:
+            item (RequestItem): the answered callback
+        """
+        # priority can be set by hand, so the endpoint may not be `/interactions/{id}/...`
+        parts = item.endpoint.strip('/').split('/')
+        if len(parts) < 2 or parts[0] != 'interactions' or not parts[1].isdigit():
+            return
+
+        interaction_id = parts[1]
+
+        # the interaction's creation time is in its snowflake
+        created = ((int(interaction_id) >> 22) + DISCORD_EPOCH) / 1000
+        elapsed = time.time() - created
+
+        if elapsed > INTERACTION_DEADLINE:
+            self.missed_deadlines += 1
+            logger.warning(
+                f"Interaction {interaction_id} answered {elapsed:.2f}s after creation, "
+                f"past the {INTERACTION_DEADLINE:.0f}s deadline. Discord may have dropped it."
+            )
+
+    def _backoff(self, attempt: int):
+        """Jittered exponential delay before retrying a server or connection error.
+
+        Args:
+            attempt (int): number of the failed attempt, from 0
+
+        Returns:
+            (float): seconds to wait
+        """
+        return 2 ** attempt * random.uniform(0.5, 1.0)
 
     async def _parse_response(self, resp: aiohttp.ClientResponse):
         """Parse the request's response for response details.
@@ -203,112 +586,201 @@ class HTTPClient:
 
             case 200 | 201:
                 # JSON body is guaranteed if successful
-                try:
-                    return await resp.json()
-                except aiohttp.ContentTypeError:
-                    return await resp.text()
+                return await self._read_body(resp)
 
             case _:
                 # error handling
-                try:
-                    body = await resp.json()
-                except aiohttp.ContentTypeError:
-                    body = await resp.text()
+                body = await self._read_body(resp)
                 raise DiscordError(resp.status, body)
             
-    async def _update_bucket_rate_limit(self, resp: aiohttp.ClientResponse, bucket_id: str, endpoint: str):
-        """Update the bucket for this endpoint and sleep if necessary.
+    async def _read_body(self, resp: aiohttp.ClientResponse):
+        """Decode a response body with the codec if it is JSON, otherwise return it as text.
 
         Args:
             resp (aiohttp.ClientResponse): the response object
-            bucket_id (str): bucket ID provided by Discord's headers
-            endpoint (str): endpoint in which request was sent
-        """
-        # grab lock from dict of bucket locks with a lock on dict access
-        async with self.buckets_lock:
-            lock = self.bucket_lock.setdefault(bucket_id, asyncio.Lock())
-
-        # update/add the bucket with Bucket lock
-        async with lock:
-            remaining = int(resp.headers.get('x-ratelimit-remaining', 1))
-            reset_after = float(resp.headers.get('x-ratelimit-reset-after', 0))
-            reset_on = float(resp.headers.get('x-ratelimit-reset', 0))
-
-            bucket = self.buckets.get(bucket_id)
 
-            if not bucket:
-                bucket = Bucket(remaining, reset_after, reset_on)
-                self.buckets[bucket_id] = bucket
-            else:
-                bucket.remaining = remaining
-                bucket.reset_after = reset_after
-                bucket.reset_on = reset_on
+        Returns:
+            (dict | list | str): response body
+        """
+        if resp.content_type != 'application/json':
+            return await resp.text()
+        
+        body = await resp.read()
+        
+        return self.codec.decode(body) if body else None
+            
+    def _update_bucket_rate_limit(self, resp: aiohttp.ClientResponse, bucket_id: str, route: str, reserved: Bucket | None):
+        """Update the bucket for this route from the response headers.
 
-            logger.debug(f"[{endpoint}] {resp.method} bucket={bucket_id} reset_on={bucket.reset_on} remaining={bucket.remaining} reset_after={bucket.reset_after:.2f}s")
+        Args:
+            resp (aiohttp.ClientResponse): the response object
+            bucket_id (str): bucket ID provided by Discord's headers
+            route (str): route key of the request
+            reserved (Bucket | None): bucket the request holds a slot in, if any
+        """
+        # no awaits below: reservations can't interleave with the update
+        limit = int(resp.headers.get('x-ratelimit-limit', 1))
+        remaining = int(resp.headers.get('x-ratelimit-remaining', 1))
+        reset_after = float(resp.headers.get('x-ratelimit-reset-after', 0))
+        reset_on = float(resp.headers.get('x-ratelimit-reset', 0))
+
+        # one hash covers every channel/guild/webhook, but each gets its own budget
+        bucket_key = f"{bucket_id}:{major_key(route)}"
+        self.route_buckets[route] = bucket_key
+
+        bucket = self.buckets.get(bucket_key)
+
+        if not bucket:
+            bucket = Bucket(remaining, reset_after, reset_on)
+            self.buckets[bucket_key] = bucket
+
+        # the header doesn't count requests still in flight
+        others = bucket.in_flight - (1 if reserved is bucket else 0)
+
+        if reset_on > bucket.reset_on or not bucket.reset_at:
+            # first answer from a new window
+            bucket.remaining = remaining - others
+        elif reset_on == bucket.reset_on:
+            bucket.remaining = min(bucket.remaining, remaining - others)
+        else:
+            # late answer from a past window
+            return
 
-            if bucket.remaining == 0 and not bucket.sleep_task:
-                bucket.sleep_task = asyncio.create_task(
-                    self._sleep_endpoint(endpoint, bucket)
-                )
+        bucket.limit = limit
+        bucket.reset_after = reset_after
+        bucket.reset_on = reset_on
+        bucket.reset_at = asyncio.get_running_loop().time() + reset_after
 
-            elif bucket.sleep_task and not bucket.sleep_task.done():
-                await bucket.sleep_task
+        logger.debug(f"[{route}] {resp.method} bucket={bucket_key} reset_on={bucket.reset_on} remaining={bucket.remaining} reset_after={bucket.reset_after:.2f}s")
 
-    async def _prepare_payload(self, item: RequestItem):
+    async def _prepare_payload(self, item: RequestItem, opened: list):
         """Prepares the payload based on `RequestItem`.
+            Files are streamed into the multipart body, never read whole.
 
         Args:
             item (RequestItem): the request object
+            opened (list): collects file objects opened for this attempt; the caller closes them
 
         Returns:
             (dict): kwargs to pass to session.request
         """
         if item.files and any(item.files):
-            # payload = await self._make_payload(item.data, item.files)
             form = aiohttp.FormData()
-            form.add_field("payload_json", json.dumps(item.data))
-
-            for idx, file_path in enumerate(item.files):
-                async with aiofiles.open(file_path, 'rb') as f:
-                    f_data = await f.read()
-                    form.add_field(
-                        f'files[{idx}]',
-                        f_data,
-                        filename=file_path.split('/')[-1],
-                        content_type='application/octet-stream'
-                    )
+            form.add_field("payload_json", self.codec.encode(item.data).decode())
+
+            for idx, file in enumerate(item.files):
+                if isinstance(file, str):
+                    # plain path
+                    payload = await asyncio.to_thread(open, file, 'rb')
+                    filename = file.split('/')[-1]
+                else:
+                    # Attachment
+                    payload = await file._payload()
+                    filename = file.to_dict()['filename']
+
+                if hasattr(payload, 'close'):
+                    opened.append(payload)
+
+                form.add_field(
+                    f'files[{idx}]',
+                    payload,
+                    filename=filename,
+                    content_type='application/octet-stream'
+                )
 
             return {"data": form}
+        
+        if item.data is None:
+            return {}
 
-        return {"json": item.data}
+        return {
+            "data": self.codec.encode(item.data), 
+            "headers": {"Content-Type": "application/json"}
+        }
 
-    async def _send(self, item: RequestItem):
+    async def _send(self, item: RequestItem, bucket: Bucket = None):
         """Core HTTP request executor.
 
         Args:
             item (RequestItem): request object
+            bucket (Bucket, optional): bucket the request holds a slot in, if any
 
         Returns:
             (dict | str | None): Parsed JSON response if available, raw text if the
                 response is not JSON, or None for HTTP 204 responses.
         """
-        await self._check_global_rate_limit()
+        url = f"{self.BASE.rstrip('/')}/{item.endpoint.lstrip('/')}"
 
-        kwargs = await self._prepare_payload(item)
+        exempt = item.endpoint.lstrip('/').startswith(GLOBAL_EXEMPT_PREFIX)
 
-        url = f"{self.BASE.rstrip('/')}/{item.endpoint.lstrip('/')}"
-        
-        async with self.session.request(
-            method=item.method, url=url, params=item.params, timeout=15, **kwargs
-        ) as resp:
-            
-            if resp.headers.get("X-RateLimit-Global") == "true":
-                retry_after = float(resp.headers.get("Retry-After", 0))
-                self.global_reset = asyncio.get_event_loop().time() + retry_after
+        session = self.session if item.priority == RequestPriorities.DEFAULT else self.priority_session
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            if not exempt:
+                await self._check_global_rate_limit()
+
+            # last attempt: let errors through
+            can_retry = attempt < self.MAX_RETRIES
+
+            opened = []
+            try:
+                kwargs = await self._prepare_payload(item, opened)
+
+                # pace before Discord has to tell us; retries count against the limit too
+                if not exempt:
+                    await self.global_limiter.acquire(item.priority)
+            except BaseException:
+                for f in opened:
+                    f.close()
+                raise
 
-            bucket_id = resp.headers.get('x-ratelimit-bucket')
+            try:
+                async with session.request(
+                    method=item.method, url=url, params=item.params, timeout=15, **kwargs
+                ) as resp:
+                    
+                    if resp.headers.get("X-RateLimit-Global") == "true":
+                        retry_after = float(resp.headers.get("Retry-After", 0))
+                        self.global_reset = asyncio.get_event_loop().time() + retry_after
+
+                    bucket_id = resp.headers.get('x-ratelimit-bucket')
+
+                    if bucket_id:
+                        self._update_bucket_rate_limit(resp, bucket_id, item.route, bucket)
+
+                    if resp.status == 429 and can_retry:
+                        self.retries['rate_limit'] += 1
+                        delay = await self._retry_after(resp)
+
+                    elif resp.status in RETRY_STATUSES and can_retry:
+                        self.retries['server_error'] += 1
+                        delay = self._backoff(attempt)
+                        logger.warning(f"{item.method} {item.endpoint} returned {resp.status}. Retrying in {delay:.2f}s...")
+
+                    else:
+                        if resp.status == 429 or resp.status in RETRY_STATUSES:
+                            self.exhausted += 1
+
+                        if item.priority == RequestPriorities.INTERACTION:
+                            self._check_deadline(item)
+                            
+                        return await self._parse_response(resp)
+                    
+            except aiohttp.ClientConnectionError as e:
+                if not can_retry:
+                    self.exhausted += 1
+                    raise
+
+                self.retries['connection'] += 1
+                delay = self._backoff(attempt)
+                logger.warning(f"{item.method} {item.endpoint} connection error: {e!r}. Retrying in {delay:.2f}s...")
+
+            finally:
+                if not exempt:
+                    self.global_limiter.release()
 
-            if bucket_id:
-                await self._update_bucket_rate_limit(resp, bucket_id, item.endpoint)
+                for f in opened:
+                    f.close()
 
-            return await self._parse_response(resp)
+            # still holds its bucket slot while waiting
+            await asyncio.sleep(delay)
@@ -0,0 +1,185 @@
+import asyncio
+import time
+import multiprocessing
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+IDENTIFY_WINDOW = 5.0
+"""Seconds between identifies in the same rate limit bucket."""
+
+BUDGET_RETRY = 1.0
+"""Seconds to wait before re-checking a session start budget whose reset has passed but wasn't refilled yet."""
+
+class IdentifyScheduler:
+    """Paces IDENTIFY for every shard in this process.
+        Shards in the same bucket (`shard_id % max_concurrency`) identify at least `window` seconds apart.
+        A bucket's next slot opens as soon as the previous identify's window ends.
+        Also holds the `session_start_limit` budget, so every shard sharing the scheduler spends the same one.
+    """
+
+    def __init__(self, max_concurrency: int, window: float = IDENTIFY_WINDOW):
+        """
+        Args:
+            max_concurrency (int): `max_concurrency` from the session start limit
+            window (float, optional): seconds between identifies in a bucket. Defaults to `IDENTIFY_WINDOW`.
+        """
+        self.max_concurrency = max_concurrency
+        self.window = window
+
+        self._next_slot = [0.0] * max_concurrency
+        """Loop time each bucket may identify again."""
+
+        self._budget = 0
+        """Session starts left until `_reset_on`."""
+
+        self._reset_on = 0.0
+        """`time.time()` the session start budget resets."""
+
+    def _refill(self, remaining: int, reset_after: float):
+        """Take the budget from `/gateway/bot`, unless the current budget's window is still open.
+
+        Args:
+            remaining (int): `session_start_limit.remaining`
+            reset_after (float): seconds until the limit resets
+        """
+        now = time.time()
+
+        # another shard (or worker) already took this window's numbers; don't reset its spending
+        if now < self._reset_on:
+            return
+
+        self._budget = remaining
+        self._reset_on = now + reset_after
+
+    def _spend(self):
+        """Take one session start from the budget.
+
+        Returns:
+            (float): 0 if taken, else seconds to wait before refilling and trying again
+        """
+        if self._budget > 0:
+            self._budget -= 1
+            return 0
+
+        return max(self._reset_on - time.time(), BUDGET_RETRY)
+
+    async def refill_session_starts(self, remaining: int, reset_after: float):
+        """Set the session start budget from a `/gateway/bot` response. Ignored until the current budget resets.
+
+        Args:
+            remaining (int): `session_start_limit.remaining`
+            reset_after (float): seconds until the limit resets
+        """
+        self._refill(remaining, reset_after)
+
+    async def spend_session_start(self):
+        """Take one session start for an IDENTIFY.
+
+        Returns:
+            (float): 0 if taken, else seconds until the budget resets (refill, then try again)
+        """
+        return self._spend()
+
+    async def acquire(self, shard_id: int):
+        """Wait until this shard may send IDENTIFY. Claims the bucket's next slot.
+
+        Args:
+            shard_id (int): ID of the identifying shard
+        """
+        bucket = shard_id % self.max_concurrency
+
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot[bucket])
+        self._next_slot[bucket] = slot + self.window
+
+        if slot > now:
+            logger.debug(f"SHARD ID {shard_id}: Waiting {slot - now:.2f}s for identify bucket {bucket}")
+            await asyncio.sleep(slot - now)
+
+class IdentifyCoordinator(IdentifyScheduler):
+    """Process-safe [`IdentifyScheduler`][scurrypy.core.identify.IdentifyScheduler] shared by every worker of a cluster.
+
+    !!! note
+        Create it in the supervisor and pass it to workers when they are spawned.
+    """
+
+    def __init__(self, max_concurrency: int, window: float = IDENTIFY_WINDOW, ctx = None):
+        """
+        Args:
+            max_concurrency (int): `max_concurrency` from the session start limit
+            window (float, optional): seconds between identifies in a bucket. Defaults to `IDENTIFY_WINDOW`.
+            ctx (multiprocessing.context.BaseContext, optional): multiprocessing context. Defaults to the default context.
+        """
+        ctx = ctx or multiprocessing.get_context()
+
+        self.max_concurrency = max_concurrency
+        self.window = window
+
+        self._lock = ctx.Lock()
+        self._next_slot = ctx.Array('d', max_concurrency, lock=False)
+        """Wall-clock time each bucket may identify again."""
+
+        self._shared_budget = ctx.Value('i', 0, lock=False)
+        self._shared_reset_on = ctx.Value('d', 0.0, lock=False)
+        """Session start budget shared by every worker, guarded by `_lock`."""
+
+    @property
+    def _budget(self):
+        return self._shared_budget.value
+
+    @_budget.setter
+    def _budget(self, value: int):
+        self._shared_budget.value = value
+
+    @property
+    def _reset_on(self):
+        return self._shared_reset_on.value
+
+    @_reset_on.setter
+    def _reset_on(self, value: float):
+        self._shared_reset_on.value = value
+
+    def _locked(self, fn, *args):
+        """Run `fn` under the cross-process lock."""
+
+        with self._lock:
+            return fn(*args)
+
+    async def refill_session_starts(self, remaining: int, reset_after: float):
+        await asyncio.to_thread(self._locked, self._refill, remaining, reset_after)
+
+    async def spend_session_start(self):
+        return await asyncio.to_thread(self._locked, self._spend)
+
+    def _reserve(self, bucket: int):
+        """Claim the bucket's next identify slot.
+
+        Args:
+            bucket (int): rate limit bucket
+
+        Returns:
+            (float): seconds to wait until the slot
+        """
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot[bucket])
+            self._next_slot[bucket] = slot + self.window
+
+        return slot - now
+
+    async def acquire(self, shard_id: int):
+        """Wait until this shard may send IDENTIFY.
+
+        Args:
+            shard_id (int): ID of the identifying shard
+        """
+        bucket = shard_id % self.max_concurrency
+
+        # the lock is shared across processes; don't block the loop on it
+        delay = await asyncio.to_thread(self._reserve, bucket)
+
+        if delay > 0:
+            logger.debug(f"SHARD ID {shard_id}: Waiting {delay:.2f}s for identify bucket {bucket}")
+            await asyncio.sleep(delay)
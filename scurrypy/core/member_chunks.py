@@ -0,0 +1,142 @@
+import asyncio
+
+class MemberChunks:
+    """Members of one guild requested over the gateway (op 8 `REQUEST_GUILD_MEMBERS`),
+        assembled from the `GUILD_MEMBERS_CHUNK` dispatches that carry its nonce.
+
+        `async for members in request` yields each chunk's members as it arrives;
+        `await request` collects every member instead. Consume a request once, one way or the other.
+    """
+
+    def __init__(self, guild_id: int, nonce: str, payload: dict, *, timeout: float = None, on_timeout = None):
+        """
+        Args:
+            guild_id (int): ID of the guild
+            nonce (str): nonce matching this request's chunks
+            payload (dict): op 8 data sent to the gateway
+            timeout (float, optional): seconds to wait for each chunk once sent. Defaults to None (no limit).
+            on_timeout (callable, optional): called with this request when it times out. Defaults to None.
+        """
+        self.guild_id = guild_id
+        self.nonce = nonce
+        self.payload = payload
+
+        self.timeout = timeout
+        """Seconds to wait for each chunk, counted from when the request is sent. The wait restarts whenever one arrives."""
+
+        self.timer: asyncio.TimerHandle = None
+        """Pending timeout, armed while the request is sent and waiting on chunks."""
+
+        self.on_timeout = on_timeout
+        """Called with this request when it times out, e.g. to forget its nonce."""
+
+        self.sent = False
+        """Whether the request has gone out. Unsent requests survive a new session."""
+
+        self.chunk_count = None
+        """Total chunks Discord will send. `None` until the first arrives."""
+
+        self.received = 0
+        """Chunks received so far."""
+
+        self.not_found: list[int] = []
+        """Requested user IDs that aren't members of the guild."""
+
+        self.presences: list[dict] = []
+        """Raw presences of the members, if requested."""
+
+        self.done = False
+        """Whether every chunk arrived or the request failed."""
+
+        self.chunks: asyncio.Queue = asyncio.Queue()
+        """Raw member lists in arrival order, then `None` (done) or an exception (failed)."""
+
+    def arm(self):
+        """Start (or restart) the wait for the next chunk. Called when the request is sent and on every chunk."""
+
+        self.disarm()
+
+        if self.timeout is not None and not self.done:
+            self.timer = asyncio.get_running_loop().call_later(self.timeout, self._expire)
+
+    def disarm(self):
+        """Stop waiting, e.g. when the request is rate limited and will be sent again."""
+
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+
+    def _expire(self):
+        """Fail the request once no chunk arrived in time, whether or not anyone is consuming it."""
+
+        self.timer = None
+        self.fail(asyncio.TimeoutError(f"No member chunk for guild {self.guild_id} within {self.timeout}s."))
+
+        if self.on_timeout:
+            self.on_timeout(self)
+
+    def feed(self, data: dict):
+        """Take in a `GUILD_MEMBERS_CHUNK` dispatch for this request.
+
+        Args:
+            data (dict): raw chunk payload
+        """
+        if self.done:
+            return
+
+        self.arm()
+
+        self.received += 1
+        self.chunk_count = data.get('chunk_count', 1)
+        self.not_found.extend(int(user_id) for user_id in data.get('not_found') or [])
+        self.presences.extend(data.get('presences') or [])
+
+        self.chunks.put_nowait(data.get('members') or [])
+
+        if self.received >= self.chunk_count:
+            self.done = True
+            self.disarm()
+            self.chunks.put_nowait(None)
+
+    def fail(self, error: Exception):
+        """End the request with an error raised to whoever is waiting on it.
+
+        Args:
+            error (Exception): error to raise
+        """
+        if self.done:
+            return
+
+        self.done = True
+        self.disarm()
+        self.chunks.put_nowait(error)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        from ..models.guild_member import GuildMemberModel
+
+        item = await self.chunks.get()
+
+        if item is None:
+            raise StopAsyncIteration
+
+        if isinstance(item, Exception):
+            raise item
+
+        return [GuildMemberModel.from_dict(member) for member in item]
+
+    def __await__(self):
+        return self._collect().__await__()
+
+    async def _collect(self):
+        """Wait for every chunk.
+
+        Raises:
+            (asyncio.TimeoutError): a chunk didn't arrive within `timeout`
+
+        Returns:
+            (list[GuildMemberModel]): every member received
+        """
+        return [member async for chunk in self for member in chunk]
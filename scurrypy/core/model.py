@@ -4,12 +4,273 @@ from typing import get_args, get_origin, Union
 """Extract the type from Optional[t]."""
 unwrap_optional = lambda t: get_args(t)[0] if get_origin(t) is Union else t
 
+def _to_bool(v):
+    """Convert a boolean field value."""
+    return v == 'true'
+
+def is_nested(t):
+    """Whether a field type holds dataclasses or containers rather than a primitive.
+
+    Args:
+        t (type): annotated field type
+
+    Returns:
+        (bool): if the field is a dataclass, list, or dict
+    """
+    t = unwrap_optional(t)
+    return is_dataclass(t) or get_origin(t) in (dict, list)
+
+def compile_converter(t, lazy: bool = False):
+    """Resolve a field type into the callable that converts its raw value.
+        Type inspection happens here once instead of on every hydration.
+
+    !!! note
+        Converters are never called with `None`. Callers skip missing values.
+
+    Args:
+        t (type): annotated field type
+        lazy (bool, optional): hydrate nested dataclasses lazily. Defaults to False.
+
+    Returns:
+        (callable): converter for a non-`None` raw value
+    """
+    t = unwrap_optional(t)
+    o = get_origin(t)
+
+    if t is bool:
+        return _to_bool
+    
+    if is_dataclass(t):
+        return t.lazy_from_dict if lazy else t.from_dict
+    
+    if o is dict:
+        vc = compile_converter(get_args(t)[1], lazy)
+        return lambda v: {
+            int(k): None if x is None else vc(x)
+            for k, x in v.items()
+        }
+    
+    if o is list:
+        lc = compile_converter(get_args(t)[0], lazy)
+        return lambda v: [None if x is None else lc(x) for x in v]
+    
+    # primitive / fallback
+    return t
+
+PRIMITIVES = (int, str, float)
+"""Immutable types whose values need no conversion when they already arrive as that type."""
+
+def compile_field(f):
+    """Compile a dataclass field into its plan entry.
+
+    Args:
+        f (Field): the dataclass field
+
+    Returns:
+        (tuple[str, callable, type | None]): field name, converter, and the type that skips conversion
+    """
+    convert = compile_converter(f.type)
+    return (f.name, convert, convert if convert in PRIMITIVES else None)
+
+def compile_hydrator(cls):
+    """Build the hydrator for a dataclass from a precomputed plan of field converters.
+
+    Args:
+        cls (type): dataclass to hydrate
+
+    Returns:
+        (callable): function turning a raw dict into `cls`
+    """
+    plan = tuple(compile_field(f) for f in fields(cls))
+
+    def hydrate(data: dict):
+        get = data.get
+        kwargs = {}
+        for name, convert, exact in plan:
+            v = get(name)
+            # e.g. ETF snowflakes are already ints
+            if v is not None and type(v) is not exact:
+                v = convert(v)
+            kwargs[name] = v
+        return cls(**kwargs)
+
+    return hydrate
+
+class LazyField:
+    """Descriptor that hydrates a nested field from the source dict on first read,
+        then caches the result on the instance.
+    """
+
+    def __init__(self, name: str, convert):
+        """
+        Args:
+            name (str): name of the field
+            convert (callable): converter for the field's raw value
+        """
+        self.name = name
+        self.convert = convert
+
+    def hydrate(self, obj):
+        """Convert the field's raw value from the instance's source dict.
+
+        Args:
+            obj (DataModel): lazily hydrated instance
+
+        Returns:
+            (Any): the hydrated value
+        """
+        v = obj._lazy_data.get(self.name)
+        return None if v is None else self.convert(v)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        
+        value = self.hydrate(obj)
+
+        # instance attribute now shadows this descriptor
+        obj.__dict__[self.name] = value
+        return value
+
+def _hydrate_slot(obj, name: str):
+    """`__getattr__` of slotted lazy classes. Only called when a slot is still empty, 
+        i.e. on the first read of a deferred field; later reads hit the slot directly.
+
+    Args:
+        obj (DataModel): lazily hydrated instance
+        name (str): attribute being read
+
+    Returns:
+        (Any): the hydrated value
+    """
+    lazy_field = type(obj)._lazy_fields.get(name)
+    if lazy_field is None:
+        raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{name}'")
+
+    value = lazy_field.hydrate(obj)
+    setattr(obj, name, value)
+    return value
+
+def _lazy_state(obj):
+    """Every attribute of a lazy instance, with deferred fields hydrated.
+
+    Args:
+        obj (DataModel): lazily hydrated instance
+
+    Returns:
+        (dict): attribute name -> value, without the source dict
+    """
+    state = {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+    # non-field attributes, e.g. an event's name and raw
+    if hasattr(obj, '__dict__'):
+        extra = vars(obj)
+    else:
+        names = (n for c in type(obj).__mro__ for n in vars(c).get('__slots__', ()))
+        extra = {n: getattr(obj, n) for n in names if not n.startswith('__') and hasattr(obj, n)}
+
+    for name, value in extra.items():
+        state.setdefault(name, value)
+
+    state.pop('_lazy_data', None)
+    return state
+
+def _rebuild(cls, state: dict):
+    """Unpickle a lazy instance as a plain instance of its dataclass.
+
+    Args:
+        cls (type): the dataclass
+        state (dict): attributes from `_lazy_state`
+
+    Returns:
+        (DataModel): the rebuilt instance
+    """
+    obj = object.__new__(cls)
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
+    return obj
+
+def _lazy_reduce(self):
+    """`__reduce__` of lazy classes: pickle as the base dataclass, fully hydrated."""
+    return _rebuild, (type(self)._lazy_base, _lazy_state(self))
+
+def _lazy_eq(self, other):
+    """`__eq__` of lazy classes: compare fields against lazy or eager instances of the base dataclass."""
+    base = type(self)._lazy_base
+    if other.__class__ is not base and getattr(other.__class__, '_lazy_base', None) is not base:
+        return NotImplemented
+
+    return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(base) if f.compare)
+
+def compile_lazy_hydrator(cls):
+    """Build a hydrator that sets primitive fields now and defers nested fields.
+
+    Nested fields (dataclasses, lists, dicts) are hydrated by a [`LazyField`][scurrypy.core.model.LazyField] 
+        on a generated subclass of `cls` the first time they are read.
+        Slotted classes keep their slots: a deferred field's slot stays empty until `__getattr__` fills it.
+
+    Args:
+        cls (type): dataclass to hydrate
+
+    Returns:
+        (callable): function turning a raw dict into a lazy `cls`
+    """
+    eager = []
+    deferred = {}
+
+    for f in fields(cls):
+        if is_nested(f.type):
+            deferred[f.name] = LazyField(f.name, compile_converter(f.type, lazy=True))
+        else:
+            eager.append(compile_field(f))
+
+    namespace = {
+        '__qualname__': f"{cls.__qualname__}.<lazy>",
+        '__module__': cls.__module__,
+        '_lazy_base': cls,
+        '__reduce__': _lazy_reduce,
+        '__eq__': _lazy_eq,
+        '__hash__': cls.__hash__
+    }
+
+    # instances only lack a __dict__ if every class in the MRO is slotted
+    if not any('__dict__' in vars(c) for c in cls.__mro__):
+        # descriptors would shadow the slots; hydrate on a miss instead
+        namespace.update(__slots__=('_lazy_data',), _lazy_fields=deferred, __getattr__=_hydrate_slot)
+    else:
+        namespace.update(deferred)
+
+    lazy_cls = type(cls)(cls.__name__, (cls,), namespace)
+
+    def hydrate(data: dict):
+        obj = object.__new__(lazy_cls)
+        obj._lazy_data = data
+
+        get = data.get
+        for name, convert, exact in eager:
+            v = get(name)
+            if v is not None and type(v) is not exact:
+                v = convert(v)
+            setattr(obj, name, v)
+        return obj
+
+    return hydrate
+
+_HYDRATORS = {}
+"""Maps a dataclass to its compiled hydrator."""
+
+_LAZY_HYDRATORS = {}
+"""Maps a dataclass to its compiled lazy hydrator."""
+
 @dataclass
 class DataModel:    
     """DataModel is a base class for Discord JSONs that provides 
         hydration from raw dicts, and optional field defaults.
     """
 
+    # subclasses declared with `@dataclass(slots=True)` get no per-instance `__dict__`
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls, data: dict):
         """Hydrates the given data into the dataclass.
@@ -23,40 +284,32 @@ class DataModel:
         if not data:
             return None
         
-        def convert(t, v):
-            t = unwrap_optional(t)
-            o = get_origin(t)
-            
-            # missing field
-            if v is None:
-                return None
-            
-            if t is bool:
-                return v == 'true'
-            
-            if is_dataclass(t):
-                return t.from_dict(v)
-            
-            if o is dict:
-                vt = get_args(t)[1]
-                return {
-                    int(k): convert(vt, x) 
-                    for k, x in v.items()
-                }
-            
-            if o is list:
-                lt = get_args(t)[0]
-                return [convert(lt, x) for x in v]
-            
-            # primitive / fallback
-            return t(v)
-        
-        kwargs = {
-            f.name: convert(f.type, data.get(f.name)) 
-            for f in fields(cls)
-        }
+        # compile once per class, reuse on every call after
+        hydrate = _HYDRATORS.get(cls)
+        if hydrate is None:
+            hydrate = _HYDRATORS[cls] = compile_hydrator(cls)
 
-        return cls(**kwargs)
+        return hydrate(data)
+    
+    @classmethod
+    def lazy_from_dict(cls, data: dict):
+        """Hydrates the given data into the dataclass, deferring nested fields.
+            Nested dataclasses, lists, and dicts are hydrated from `data` the first time they are read.
+
+        Args:
+            data (dict): the JSON data
+
+        Returns:
+            (cls): lazily hydrated dataclass
+        """
+        if not data:
+            return None
+
+        hydrate = _LAZY_HYDRATORS.get(cls)
+        if hydrate is None:
+            hydrate = _LAZY_HYDRATORS[cls] = compile_lazy_hydrator(cls)
+
+        return hydrate(data)
         
     def to_dict(self):
         """Recursively turns the dataclass into a dictionary and drops empty fields.
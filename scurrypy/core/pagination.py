@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime
+
+from .http import DISCORD_EPOCH
+
+def to_snowflake(value: int | datetime):
+    """Turn a stop bound into a snowflake. Datetimes become the first snowflake of that millisecond.
+
+    Args:
+        value (int | datetime): snowflake or timestamp (naive datetimes are local time)
+
+    Returns:
+        (int): the snowflake
+    """
+    if isinstance(value, datetime):
+        return max(int(value.timestamp() * 1000) - DISCORD_EPOCH, 0) << 22
+
+    return int(value)
+
+async def paginate(
+    fetch_page,
+    key,
+    *,
+    cursor: int = None,
+    page_size: int,
+    ascending: bool,
+    count: int = None,
+    until: int | datetime = None
+):
+    """Walk a snowflake-paged listing, fetching the next page while the caller processes the current one.
+        Pages go through the HTTP client like any request, so route buckets still pace them.
+
+    Args:
+        fetch_page (callable): `async (cursor, limit) -> list[dict]`; `cursor` is None for the first page.
+            It should raise on failure: a failed page must not pass for the end of the listing.
+        key (callable): raw item -> its snowflake
+        cursor (int, optional): snowflake to start after (ascending) or before (descending). Defaults to None.
+        page_size (int): max items per request
+        ascending (bool): whether items go from low to high snowflakes
+        count (int, optional): stop after this many items. Defaults to None (all).
+        until (int | datetime, optional): stop at this snowflake or timestamp, exclusive. Defaults to None.
+
+    Raises:
+        (DiscordError): a page request failed, propagated from `fetch_page`
+
+    Yields:
+        (dict): raw items in order
+    """
+    bound = None if until is None else to_snowflake(until)
+    remaining = count
+
+    def request(cursor):
+        # never ask for more than the count still needs
+        size = page_size if remaining is None else min(page_size, remaining)
+        return size, asyncio.create_task(fetch_page(cursor, size))
+
+    if remaining is not None and remaining <= 0:
+        return
+
+    size, task = request(cursor)
+
+    try:
+        while task:
+            page = await task
+            task = None
+
+            if not page:
+                return
+
+            # pages may be shared with coalesced GETs: sort a copy
+            page = sorted(page, key=key, reverse=not ascending)
+
+            # a short page is the last one
+            done = len(page) < size
+
+            if bound is not None:
+                inside = [item for item in page if (key(item) < bound if ascending else key(item) > bound)]
+                done = done or len(inside) < len(page)
+                page = inside
+
+            if remaining is not None:
+                page = page[:remaining]
+                remaining -= len(page)
+                done = done or remaining <= 0
+
+            if not done:
+                size, task = request(key(page[-1]))
+
+            for item in page:
+                yield item
+    finally:
+        # caller stopped early: drop the prefetched page
+        if task:
+            task.cancel()
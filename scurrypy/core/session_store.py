@@ -0,0 +1,172 @@
+import asyncio
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class SessionState:
+    """What a shard needs to RESUME its session."""
+
+    session_id: str
+    """ID of the gateway session."""
+
+    seq: int
+    """Last sequence number received."""
+
+    resume_gateway_url: str
+    """Gateway URL for resuming."""
+
+class SessionStore(ABC):
+    """Base class for saving shard sessions so they can RESUME after a restart.
+        Sessions are keyed by shard ID and total shard count.
+    """
+
+    @abstractmethod
+    async def load(self, shard_id: int, total_shards: int):
+        """Load a shard's saved session.
+
+        Args:
+            shard_id (int): ID of the shard
+            total_shards (int): total shard count
+
+        Returns:
+            (SessionState | None): saved session or None
+        """
+
+    @abstractmethod
+    async def save(self, shard_id: int, total_shards: int, state: SessionState):
+        """Save a shard's session.
+
+        Args:
+            shard_id (int): ID of the shard
+            total_shards (int): total shard count
+            state (SessionState): session to save
+        """
+
+    @abstractmethod
+    async def delete(self, shard_id: int, total_shards: int):
+        """Forget a shard's session, e.g. once Discord invalidated it.
+
+        Args:
+            shard_id (int): ID of the shard
+            total_shards (int): total shard count
+        """
+
+class MemorySessionStore(SessionStore):
+    """Keeps sessions in memory. Survives a client restart within the same process."""
+
+    def __init__(self):
+        self.sessions: dict[str, SessionState] = {}
+
+    async def load(self, shard_id: int, total_shards: int):
+        return self.sessions.get(f"{shard_id}/{total_shards}")
+
+    async def save(self, shard_id: int, total_shards: int, state: SessionState):
+        self.sessions[f"{shard_id}/{total_shards}"] = state
+
+    async def delete(self, shard_id: int, total_shards: int):
+        self.sessions.pop(f"{shard_id}/{total_shards}", None)
+
+@contextmanager
+def _file_lock(path: str):
+    """Hold an exclusive lock on `path` across processes. Blocks until it's free.
+
+    Args:
+        path (str): lock file, created if missing
+    """
+    with open(path, 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+class FileSessionStore(SessionStore):
+    """Keeps sessions in a JSON file. Survives process restarts and deploys.
+        Safe to share between processes, e.g. every worker of a [`Cluster`][scurrypy.cluster.Cluster].
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): path to the JSON file
+        """
+        self.path = path
+
+    def _read(self):
+        """Read every saved session.
+
+        Returns:
+            (dict): `shard_id/total_shards` -> session fields
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.warning(f"Could not read session store {self.path}. Starting fresh.")
+            return {}
+
+    def _write(self, key: str, fields: dict | None):
+        """Merge one session into the file, or remove it. Other processes' sessions are kept.
+
+        Args:
+            key (str): `shard_id/total_shards`
+            fields (dict | None): session fields, or None to remove the session
+        """
+        # the read-merge-replace must not interleave with another process's
+        with _file_lock(f"{self.path}.lock"):
+            sessions = self._read()
+
+            if fields is None:
+                if key not in sessions:
+                    return
+                del sessions[key]
+            else:
+                sessions[key] = fields
+
+            # write a private temp file, then swap so a crash never leaves a half-written file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(sessions, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+    async def load(self, shard_id: int, total_shards: int):
+        data = (await asyncio.to_thread(self._read)).get(f"{shard_id}/{total_shards}")
+
+        return SessionState(**data) if data else None
+
+    async def save(self, shard_id: int, total_shards: int, state: SessionState):
+        # file locks block, so keep them off the event loop
+        await asyncio.to_thread(self._write, f"{shard_id}/{total_shards}", asdict(state))
+
+    async def delete(self, shard_id: int, total_shards: int):
+        await asyncio.to_thread(self._write, f"{shard_id}/{total_shards}", None)
@@ -1,6 +1,23 @@
-class Event:
+class EventMeta(type):
+    """Gives slotted event classes the `name` and `raw` slots. 
+        `Event` can't hold them itself: its subclasses also inherit a slotted model, and two slotted bases conflict.
+    """
+
+    def __new__(mcs, cls_name: str, bases: tuple, namespace: dict, **kwargs):
+        # `dataclass(slots=True)` rebuilds the class through its metaclass with `__slots__` set
+        if bases and '__slots__' in namespace:
+            inherited = {s for base in bases for c in base.__mro__ for s in getattr(c, '__slots__', ())}
+            namespace['__slots__'] = tuple(namespace['__slots__']) + tuple(
+                s for s in ('name', 'raw') if s not in inherited and s not in namespace['__slots__']
+            )
+
+        return super().__new__(mcs, cls_name, bases, namespace, **kwargs)
+
+class Event(metaclass=EventMeta):
     """Marker class for all gateway events."""
 
+    __slots__ = ()
+
     name: str
     """Dispatch name of event."""
 
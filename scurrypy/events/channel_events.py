@@ -6,19 +6,22 @@ from typing import Optional
 
 from ..models.channel import ChannelModel
 
+@dataclass(slots=True)
 class GuildChannelCreateEvent(Event, ChannelModel):
     """Received when a guild channel has been created."""
     pass
 
+@dataclass(slots=True)
 class GuildChannelUpdateEvent(Event, ChannelModel):
     """Received when a guild channel has been updated."""
     pass
 
+@dataclass(slots=True)
 class GuildChannelDeleteEvent(Event, ChannelModel):
     """Received when a guild channel has been deleted."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ChannelPinsUpdateEvent(Event, DataModel):
     """Pin update event."""
     
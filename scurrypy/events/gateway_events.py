@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from ..core.model import DataModel
 from .base_event import Event
 
-@dataclass
+@dataclass(slots=True)
 class SessionStartLimit(Event, DataModel):
     """Represents the Session Start Limit object."""
 
@@ -18,7 +18,7 @@ class SessionStartLimit(Event, DataModel):
     max_concurrency: int
     """How many shards can be started at once."""
 
-@dataclass
+@dataclass(slots=True)
 class GatewayEvent(Event, DataModel):
     """Represents the Gateway Event object."""
 
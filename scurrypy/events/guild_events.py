@@ -7,7 +7,7 @@ from ..models.guild_member import GuildMemberModel
 from ..models.channel import ChannelModel
 from ..models.guild import UnavailableGuild, GuildModel
 
-@dataclass
+@dataclass(slots=True)
 class GuildCreateEvent(Event, GuildModel):
     """Received when the bot has joined a guild."""
     
@@ -32,7 +32,7 @@ class GuildCreateEvent(Event, GuildModel):
     unavailable: Optional[bool]
     """`True` if the guild is unavailable due to an outage."""
 
-@dataclass
+@dataclass(slots=True)
 class GuildUpdateEvent(Event, DataModel):
     """Received when a guild has been edited."""
 
@@ -60,12 +60,12 @@ class GuildUpdateEvent(Event, DataModel):
     member_count: int
     """Total number of members in the guild."""
 
-@dataclass
+@dataclass(slots=True)
 class GuildDeleteEvent(Event, UnavailableGuild):
     """Received when the bot has left a guild or the guild was deleted."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class GuildMemberAddEvent(Event, GuildMemberModel):
     """Received when a member joins a guild the bot is in.
 
@@ -79,7 +79,7 @@ class GuildMemberAddEvent(Event, GuildMemberModel):
 
 from ..models.user import UserModel
 
-@dataclass
+@dataclass(slots=True)
 class GuildMemberUpdateEvent(Event, DataModel):
     """Received when a guild member is updated.
     
@@ -104,7 +104,7 @@ class GuildMemberUpdateEvent(Event, DataModel):
     joined_at: str
     """When the user joined the guild"""
 
-@dataclass
+@dataclass(slots=True)
 class GuildMemberRemoveEvent(Event, DataModel):
     """Received when a member leaves or is kicked/banned from a guild the bot is in.
     
@@ -121,7 +121,7 @@ class GuildMemberRemoveEvent(Event, DataModel):
 
 from ..models.emoji import EmojiModel
 
-@dataclass
+@dataclass(slots=True)
 class GuildEmojisUpdateEvent(Event, DataModel):
     """Received when a guild updates their emojis."""
 
@@ -13,7 +13,7 @@ from ..models.channel import ChannelModel
 from ..models.message import MessageModel
 from ..models.attachment import AttachmentModel
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedData(DataModel):
     """Represents the resolved data object."""
 
@@ -41,7 +41,7 @@ class ResolvedData(DataModel):
 
 # ----- Command Interaction -----
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationCommandOptionData(DataModel):
     """Represents the response options from a slash command."""
     
@@ -65,7 +65,7 @@ class ApplicationCommandOptionData(DataModel):
     focused: bool
     """Whether this option is the currently focused option for autocomplete."""
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationCommandData(DataModel):
     """Represents the response from a command."""
 
@@ -118,7 +118,7 @@ class ApplicationCommandData(DataModel):
 
 # ----- Component Interaction -----
 
-@dataclass
+@dataclass(slots=True)
 class MessageComponentData(DataModel):
     """Represents the select response from a select component."""
 
@@ -136,7 +136,7 @@ class MessageComponentData(DataModel):
 
 # ----- Modal Interaction -----
 
-@dataclass
+@dataclass(slots=True)
 class ModalComponentData(DataModel):
     """Represents the modal field response from a modal."""
 
@@ -152,7 +152,7 @@ class ModalComponentData(DataModel):
     values: Optional[list[str]] = field(default_factory=list)
     """String select values (String Select component only)."""
 
-@dataclass
+@dataclass(slots=True)
 class ModalComponent(DataModel):
     """Represents the modal component response from a modal."""
 
@@ -162,7 +162,7 @@ class ModalComponent(DataModel):
     component: ModalComponentData
     """Data associated with the component."""
 
-@dataclass
+@dataclass(slots=True)
 class ModalData(DataModel):
     """Represents the modal response from a modal."""
     
@@ -210,7 +210,7 @@ class ModalData(DataModel):
 
         raise ValueError(f"Component custom ID '{custom_id}' not found.")
 
-@dataclass
+@dataclass(slots=True)
 class InteractionEvent(Event, InteractionModel):
     """Represents the interaction response."""
 
@@ -219,19 +219,41 @@ class InteractionEvent(Event, InteractionModel):
 
     @classmethod
     def from_dict(cls, data: dict):
-        from ..models.interaction import InteractionTypes
-        
-        obj = super().from_dict(data) # InteractionModel's DataModel
+        # dataclass(slots=True) rebuilds the class, so zero-argument super() would point at the old one
+        obj = super(InteractionEvent, cls).from_dict(data) # InteractionModel's DataModel
+
+        data_model = cls._data_model(data.get("type"))
+        if data_model:
+            obj.data = data_model.from_dict(data.get("data"))
+
+        return obj
+    
+    @classmethod
+    def lazy_from_dict(cls, data: dict):
+        obj = super(InteractionEvent, cls).lazy_from_dict(data)
+
+        data_model = cls._data_model(data.get("type"))
+        if data_model:
+            obj.data = data_model.lazy_from_dict(data.get("data"))
+
+        return obj
+    
+    @staticmethod
+    def _data_model(interaction_type: int):
+        """Pick the data class for the interaction's data by interaction type.
 
-        interaction_data = data.get("data")
-        interaction_type = data.get("type")
+        Args:
+            interaction_type (int): type of interaction
+
+        Returns:
+            (type | None): data class or None if the type has no special data
+        """
+        from ..models.interaction import InteractionTypes
 
         match interaction_type:
             case InteractionTypes.APPLICATION_COMMAND | InteractionTypes.APPLICATION_COMMAND_AUTOCOMPLETE:
-                obj.data = ApplicationCommandData.from_dict(interaction_data)
+                return ApplicationCommandData
             case InteractionTypes.MESSAGE_COMPONENT:
-                obj.data = MessageComponentData.from_dict(interaction_data)
+                return MessageComponentData
             case InteractionTypes.MODAL_SUBMIT:
-                obj.data = ModalData.from_dict(interaction_data)
-
-        return obj
+                return ModalData
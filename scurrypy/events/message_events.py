@@ -7,7 +7,7 @@ from typing import Optional
 from ..models.message import MessageModel
 from ..models.guild_member import GuildMemberModel
 
-@dataclass
+@dataclass(slots=True)
 class MessageCreateEvent(Event, MessageModel):
     """Received when a message is created. (This event IS the MessageModel with extra fields)
     
@@ -21,7 +21,7 @@ class MessageCreateEvent(Event, MessageModel):
     member: Optional[GuildMemberModel]  # guild-only author info
     """Partial Member object of the author of the message. See [`GuildMemberModel`][scurrypy.models.GuildMemberModel]."""
 
-@dataclass
+@dataclass(slots=True)
 class MessageUpdateEvent(Event, MessageModel):
     """Received when a message is updated. (This event IS the MessageModel with extra fields)"""
 
@@ -31,7 +31,7 @@ class MessageUpdateEvent(Event, MessageModel):
     member: Optional[GuildMemberModel]
     """Partial Member object of the author of the message. See [`GuildMemberModel`][scurrypy.models.GuildMemberModel]."""
 
-@dataclass
+@dataclass(slots=True)
 class MessageDeleteEvent(Event, DataModel):
     """Received when a message is deleted."""
 
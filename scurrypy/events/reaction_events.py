@@ -16,7 +16,7 @@ class ReactionType:
     BURST = 1
     """A super emoji."""
 
-@dataclass
+@dataclass(slots=True)
 class ReactionAddEvent(Event, DataModel):
     """Reaction added event."""
 
@@ -47,7 +47,7 @@ class ReactionAddEvent(Event, DataModel):
     message_author_id: Optional[int]
     """ID of the user who sent the message where the reaction was added."""
 
-@dataclass
+@dataclass(slots=True)
 class ReactionRemoveEvent(Event, DataModel):
     """Reaction removed event."""
 
@@ -72,6 +72,7 @@ class ReactionRemoveEvent(Event, DataModel):
     burst: bool
     """If the emoji of the removed reaction is super."""
 
+@dataclass(slots=True)
 class ReactionRemoveAllEvent(Event, DataModel):
     """Remove all reactions event."""
 
@@ -84,7 +85,7 @@ class ReactionRemoveAllEvent(Event, DataModel):
     guild_id: Optional[int]
     """ID of the guild where all reaction were removed (if in a guild)."""
 
-@dataclass
+@dataclass(slots=True)
 class ReactionRemoveEmojiEvent(Event, DataModel):
     """All reactions of a specific emoji removed."""
 
@@ -6,7 +6,7 @@ from ..models.user import UserModel
 from ..models.guild import ReadyGuildModel
 from ..models.application import ApplicationModel
 
-@dataclass
+@dataclass(slots=True)
 class ReadyEvent(Event, DataModel):
     """Received when bot goes online."""
 
@@ -4,7 +4,7 @@ from .base_event import Event
 
 from ..models.role import RoleModel
 
-@dataclass
+@dataclass(slots=True)
 class RoleCreateEvent(Event, DataModel):
     """Received when a guild role is created."""
 
@@ -14,7 +14,7 @@ class RoleCreateEvent(Event, DataModel):
     role: RoleModel
     """The new role."""
 
-@dataclass
+@dataclass(slots=True)
 class RoleUpdateEvent(Event, DataModel):
     """Received when a guild role is updated."""
 
@@ -24,7 +24,7 @@ class RoleUpdateEvent(Event, DataModel):
     role: RoleModel
     """The new role."""
 
-@dataclass
+@dataclass(slots=True)
 class RoleDeleteEvent(Event, DataModel):
     """Received when a guild role is deleted."""
 
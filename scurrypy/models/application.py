@@ -30,7 +30,7 @@ class ApplicationFlags:
     GATEWAY_MESSAGE_CONTENT_LIMITED = 1 << 19
     """Intent to receive message content."""
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationModel(DataModel):
     """Represents a Discord application."""
 
@@ -6,7 +6,7 @@ from typing import Optional
 
 from .message import MessageModel
 
-@dataclass
+@dataclass(slots=True)
 class PinnedMessageModel(DataModel):
     """Pinned message data."""
 
@@ -16,7 +16,7 @@ class PinnedMessageModel(DataModel):
     pinned_at: Optional[str]
     """ISO8601 timestamp of when the message was pinned."""
 
-@dataclass
+@dataclass(slots=True)
 class ChannelModel(DataModel):
     """Represents a Discord guild channel."""
 
@@ -46,7 +46,7 @@ class ApplicationCommandOptionTypes:
     ATTACHMENT = 11
     """file upload (See [Attachment][scurrypy.parts.message.Attachment])"""
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationCommandOptionChoiceModel(DataModel):
     """Represents the application command option choice object."""
 
@@ -60,7 +60,7 @@ class ApplicationCommandOptionChoiceModel(DataModel):
         Convert based on expected type (str, int or double)
     """
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationCommandOptionModel(DataModel):
     """Represents the application command option object."""
 
@@ -98,7 +98,7 @@ class ApplicationCommandOptionModel(DataModel):
     """Whether autocomplete interactions are enabled for this option."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationCommandModel(DataModel):
     """Represents the application command object."""
 
@@ -3,7 +3,7 @@ from ..core.model import DataModel
 
 from urllib.parse import quote
 
-@dataclass
+@dataclass(slots=True)
 class EmojiModel(DataModel):
     """Represents a Discord emoji."""
     
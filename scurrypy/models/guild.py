@@ -6,7 +6,7 @@ from typing import Optional
 from .emoji import EmojiModel
 from .role import RoleModel
 
-@dataclass
+@dataclass(slots=True)
 class ReadyGuildModel(DataModel):
     """Guild info from Ready event."""
     
@@ -16,12 +16,12 @@ class ReadyGuildModel(DataModel):
     unavailable: bool
     """If the guild is offline."""
 
-@dataclass
+@dataclass(slots=True)
 class UnavailableGuild(DataModel):
     id: int
     unavailable: bool
 
-@dataclass
+@dataclass(slots=True)
 class GuildModel(DataModel):
     """Represents a Discord guild."""
 
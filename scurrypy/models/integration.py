@@ -5,7 +5,7 @@ from typing import Optional
 
 from .application import ApplicationModel
 
-@dataclass
+@dataclass(slots=True)
 class IntegrationModel(DataModel):
     """Represents a guild integration."""
 
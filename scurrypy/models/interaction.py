@@ -66,7 +66,7 @@ class InteractionCallbackTypes:
     LAUNCH_ACTIVITY = 12
     """Launch an activity associated with the app (Activities must be enabled)."""
 
-@dataclass
+@dataclass(slots=True)
 class InteractionCallbackDataModel(DataModel):
     """Represents the interaction callback object."""
 
@@ -90,14 +90,14 @@ class InteractionCallbackDataModel(DataModel):
     response_message_ephemeral: bool
     """If the interaction is ephemeral."""
 
-@dataclass
+@dataclass(slots=True)
 class InteractionCallbackModel(DataModel):
     """Represents the interaction callback response object."""
 
     interaction: InteractionCallbackDataModel
     """The interaction object associated with the interaction response."""
 
-@dataclass
+@dataclass(slots=True)
 class InteractionModel(DataModel):
     """Represents the interaction model."""
 
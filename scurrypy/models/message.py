@@ -5,7 +5,7 @@ from typing import Optional
 
 from .user import UserModel
 
-@dataclass
+@dataclass(slots=True)
 class MessageModel(DataModel):
     """A Discord message."""
 
@@ -3,7 +3,7 @@ from ..core.model import DataModel
 
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class RoleColorModel(DataModel):
     """Role color data."""
 
@@ -16,7 +16,7 @@ class RoleColorModel(DataModel):
     tertiary_color: int
     """Tertiary color of the role. Creates a holographic style."""
 
-@dataclass
+@dataclass(slots=True)
 class RoleModel(DataModel):
     """Represents a Discord role."""
 
@@ -3,7 +3,7 @@ from ..core.model import DataModel
 
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class UserModel(DataModel):
     """Describes the User object."""
 
@@ -1,7 +1,13 @@
+import asyncio
+import os
+import tempfile
+import weakref
+import aiofiles
+from io import BytesIO
 from dataclasses import dataclass, field
 from ..core.model import DataModel
 
-from typing import Optional, TypedDict, Unpack
+from typing import AsyncIterable, Optional, TypedDict, Unpack
 
 from .embed import EmbedPart
 from .components import ActionRowPart
@@ -65,24 +71,82 @@ class MessageReference(DataModel):
 
 @dataclass
 class Attachment(DataModel):
-    """Represents an attachment."""
+    """Represents an attachment. Give either a `path` or in-memory `data`.
+        Uploads are streamed, so the same attachment can be sent to many channels without loading it again.
+    """
 
     id: int = field(init=False, default=None)
     """ID of the attachment (internally set)."""
 
     path: str = None
-    """Relative path to the file."""
+    """Relative path to the file. Streamed from disk on every send."""
 
     description: str = None
     """Description of the file."""
 
+    data: bytes | BytesIO | AsyncIterable[bytes] = None
+    """File contents, if not using `path`. Bytes and `BytesIO` are sent without copying.
+
+    !!! note
+        An async iterable can only be read once, so it is written to a temporary file on first send and streamed from there.
+    """
+
+    filename: str = None
+    """Name of the file. Defaults to the name in `path`. Required with `data`."""
+
+    _spool_path: str = field(init=False, default=None, repr=False)
+    """Temporary file holding a consumed async iterable."""
+
+    _spool_task: asyncio.Task = field(init=False, default=None, repr=False)
+    """Spooling in progress, shared by concurrent sends."""
+
+    def __post_init__(self):
+        if (self.path is None) == (self.data is None):
+            raise ValueError("Attachment needs exactly one of path or data.")
+        
+        if self.data is not None and not self.filename:
+            raise ValueError("Attachment with data needs a filename.")
+
     def to_dict(self):
         return {
             'id': self.id,
-            'filename': self.path.split('/')[-1],
+            'filename': self.filename or self.path.split('/')[-1],
             'description': self.description
         }
 
+    async def _payload(self):
+        """Open this attachment's contents for one upload.
+
+        Returns:
+            (BinaryIO | bytes | memoryview): file object to stream (the caller closes it) or buffer to send as is
+        """
+        if isinstance(self.data, (bytes, bytearray, memoryview)):
+            return self.data
+        
+        if isinstance(self.data, BytesIO):
+            # a view, so the position of the caller's BytesIO doesn't matter
+            return self.data.getbuffer()
+        
+        if self.data is not None:
+            if not self._spool_task:
+                self._spool_task = asyncio.ensure_future(self._spool())
+            await self._spool_task
+
+        return await asyncio.to_thread(open, self._spool_path or self.path, 'rb')
+
+    async def _spool(self):
+        """Write the async iterable to a temporary file that lives as long as this attachment."""
+
+        fd, path = tempfile.mkstemp(prefix='scurrypy-', suffix=f"-{self.filename}")
+        os.close(fd)
+        weakref.finalize(self, os.remove, path)
+
+        async with aiofiles.open(path, 'wb') as f:
+            async for chunk in self.data:
+                await f.write(chunk)
+
+        self._spool_path = path
+
 @dataclass
 class MessagePart(DataModel):
     """Describes expected params when editing/creating a message."""
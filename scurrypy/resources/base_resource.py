@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from ..core.http import HTTPClient
+from ..core.cache import EntityCache
 
 @dataclass
 class BaseResource:
@@ -12,3 +13,6 @@ class BaseResource:
 
     context: Any
     """Associated user data."""
+
+    _cache: EntityCache = field(default=None, kw_only=True)
+    """Entity cache read by `get_*` methods. `None` if the client has no cache."""
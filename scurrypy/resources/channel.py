@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import TypedDict, Unpack, Literal
 
 from .base_resource import BaseResource
 
+from ..core.pagination import paginate
+
 from ..parts.channel import GuildChannel
 from ..parts.message import MessagePart
 
@@ -59,6 +62,19 @@ class Channel(BaseResource):
 
         return ChannelModel.from_dict(data)
     
+    async def get(self):
+        """Get this channel from the entity cache, or fetch it if it isn't cached.
+
+        Returns:
+            (ChannelModel): the Channel object
+        """
+        data = self._cache.get_channel(self.id) if self._cache else None
+
+        if data is None:
+            return await self.fetch()
+
+        return ChannelModel.from_dict(data)
+    
     async def fetch_messages(self, **kwargs: Unpack[MessagesFetchParams]):
         """Fetches this channel's messages.
 
@@ -80,6 +96,53 @@ class Channel(BaseResource):
 
         return [MessageModel.from_dict(msg) for msg in data]
     
+    async def iter_messages(self, 
+        *, 
+        before: int = None, 
+        after: int = None, 
+        count: int = None, 
+        until: int | datetime = None
+    ):
+        """Iterate over this channel's messages, fetching pages of 100 as needed.
+            The next page is fetched while the current one is being processed.
+
+        Permissions:
+            * VIEW_CHANNEL → required to access channel messages
+            * READ_MESSAGE_HISTORY → required for user, otherwise no messages are returned
+
+        Args:
+            before (int, optional): start before this message ID and go back in time. Defaults to the newest message.
+            after (int, optional): start after this message ID and go forward in time instead. 
+                `0` starts from the oldest message. Defaults to None.
+            count (int, optional): stop after this many messages. Defaults to None (all).
+            until (int | datetime, optional): stop at this message ID or timestamp. Defaults to None.
+
+        Raises:
+            (DiscordError): a page request failed, so the listing would be incomplete
+
+        Yields:
+            (MessageModel): messages, newest first (or oldest first with `after`)
+        """
+        ascending = after is not None
+
+        async def fetch_page(cursor: int, limit: int):
+            params = {'limit': limit}
+            if cursor is not None:
+                params['after' if ascending else 'before'] = cursor
+
+            return await self._http.request('GET', f'/channels/{self.id}/messages', params=params, raise_errors=True)
+
+        async for msg in paginate(
+            fetch_page, 
+            lambda msg: int(msg['id']), 
+            cursor=after if ascending else before, 
+            page_size=100, 
+            ascending=ascending, 
+            count=count, 
+            until=until
+        ):
+            yield MessageModel.from_dict(msg)
+    
     async def send(self, message: str | MessagePart):
         """
         Send a message to this channel.
@@ -102,7 +165,7 @@ class Channel(BaseResource):
             "POST", 
             f"/channels/{self.id}/messages", 
             data=message._prepare().to_dict(),
-            files=[fp.path for fp in message.attachments]
+            files=message.attachments
         )
 
         return MessageModel.from_dict(data)
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, TypedDict, Unpack
 
 from .base_resource import BaseResource
 
+from ..core.pagination import paginate
+
 from ..parts.channel import GuildChannel
 from ..parts.role import Role
 
@@ -49,6 +52,19 @@ class Guild(BaseResource):
         data = await self._http.request('GET', f'/guilds/{self.id}', params=params)
 
         return GuildModel.from_dict(data)
+    
+    async def get(self):
+        """Get this guild from the entity cache, or fetch it if it isn't cached.
+
+        Returns:
+            (GuildModel): the Guild object
+        """
+        data = self._cache.get_guild(self.id) if self._cache else None
+
+        if data is None:
+            return await self.fetch()
+
+        return GuildModel.from_dict(data)
 
     async def fetch_channels(self):
         """Fetch this guild's channels.
@@ -59,6 +75,19 @@ class Guild(BaseResource):
         data = await self._http.request('GET', f'guilds/{self.id}/channels')
 
         return [ChannelModel.from_dict(channel) for channel in data]
+    
+    async def get_channels(self):
+        """Get this guild's channels from the entity cache, or fetch them if they aren't all cached.
+
+        Returns:
+            (list[ChannelModel]): list of the guild's channels
+        """
+        data = self._cache.get_guild_channels(self.id) if self._cache else None
+
+        if data is None:
+            return await self.fetch_channels()
+
+        return [ChannelModel.from_dict(channel) for channel in data]
 
     async def create_channel(self, channel: GuildChannel):
         """Create a channel in this guild.
@@ -91,6 +120,22 @@ class Guild(BaseResource):
 
         return GuildMemberModel.from_dict(data)
     
+    async def get_guild_member(self, user_id: int):
+        """Get a member of this guild from the entity cache, or fetch it if it isn't cached.
+
+        Args:
+            user_id (int): user ID of the member to get
+
+        Returns:
+            (GuildMemberModel): member's data
+        """
+        data = self._cache.get_member(self.id, user_id) if self._cache else None
+
+        if data is None:
+            return await self.fetch_guild_member(user_id)
+
+        return GuildMemberModel.from_dict(data)
+    
     async def fetch_guild_members(self, **kwargs: Unpack[FetchGuildMembersParams]):
         """Fetch guild members in this guild.
         !!! warning "Important"
@@ -109,6 +154,42 @@ class Guild(BaseResource):
         data = await self._http.request('GET', f'/guilds/{self.id}/members', params=params)
 
         return [GuildMemberModel.from_dict(member) for member in data]
+    
+    async def iter_guild_members(self, *, after: int = None, count: int = None, until: int | datetime = None):
+        """Iterate over this guild's members by user ID, fetching pages of 1000 as needed.
+            The next page is fetched while the current one is being processed.
+        !!! warning "Important"
+            Requires the GUILD_MEMBERS privileged intent!
+
+        Args:
+            after (int, optional): start after this user ID. Defaults to the lowest.
+            count (int, optional): stop after this many members. Defaults to None (all).
+            until (int | datetime, optional): stop at this user ID, or at users created after this timestamp. 
+                Defaults to None.
+
+        Raises:
+            (DiscordError): a page request failed, so the listing would be incomplete
+
+        Yields:
+            (GuildMemberModel): members in ascending user ID order
+        """
+        async def fetch_page(cursor: int, limit: int):
+            params = {'limit': limit}
+            if cursor is not None:
+                params['after'] = cursor
+
+            return await self._http.request('GET', f'/guilds/{self.id}/members', params=params, raise_errors=True)
+
+        async for member in paginate(
+            fetch_page, 
+            lambda member: int(member['user']['id']), 
+            cursor=after, 
+            page_size=1000, 
+            ascending=True, 
+            count=count, 
+            until=until
+        ):
+            yield GuildMemberModel.from_dict(member)
 
     async def add_guild_member_role(self, user_id: int, role_id: int):
         """Append a role to a guild member of this guild.
@@ -146,6 +227,22 @@ class Guild(BaseResource):
         data = await self._http.request('GET', f'/guilds/{self.id}/roles/{role_id}')
         
         return RoleModel.from_dict(data)
+    
+    async def get_guild_role(self, role_id: int):
+        """Get a role of this guild from the entity cache, or fetch it if it isn't cached.
+
+        Args:
+            role_id (int): ID of the role to get
+
+        Returns:
+            (RoleModel): role's data
+        """
+        data = self._cache.get_role(role_id, self.id) if self._cache else None
+
+        if data is None:
+            return await self.fetch_guild_role(role_id)
+
+        return RoleModel.from_dict(data)
 
     async def fetch_guild_roles(self):
         """Fetch all roles in this guild.
@@ -156,6 +253,19 @@ class Guild(BaseResource):
         data = await self._http.request('GET', f'/guilds/{self.id}/roles')
         
         return [RoleModel.from_dict(role) for role in data]
+    
+    async def get_guild_roles(self):
+        """Get all roles of this guild from the entity cache, or fetch them if they aren't all cached.
+
+        Returns:
+            (list[RoleModel]): list of roles' data
+        """
+        data = self._cache.get_guild_roles(self.id) if self._cache else None
+
+        if data is None:
+            return await self.fetch_guild_roles()
+
+        return [RoleModel.from_dict(role) for role in data]
 
     async def create_guild_role(self, role: Role):
         """Create a role in this guild.
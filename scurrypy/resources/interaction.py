@@ -47,7 +47,7 @@ class Interaction(BaseResource):
             'POST', 
             f'/interactions/{self.id}/{self.token}/callback', 
             data=content, 
-            files=[fp.path for fp in message.attachments],
+            files=message.attachments,
             params={'with_response': with_response}
         )
 
@@ -77,7 +77,7 @@ class Interaction(BaseResource):
             'POST', 
             f'/interactions/{self.id}/{self.token}/callback', 
             data=content, 
-            files=[fp.path for fp in message.attachments])
+            files=message.attachments)
 
     async def respond_modal(self, modal: ModalPart):
         """Create a modal in response to an interaction.
@@ -48,7 +48,7 @@ class Message(BaseResource):
             "POST",
             f"/channels/{self.channel_id}/messages",
             data=message._prepare().to_dict(),
-            files=[fp.path for fp in message.attachments] if message.attachments else None
+            files=message.attachments if message.attachments else None
         )
         return MessageModel.from_dict(data)
 
@@ -73,7 +73,7 @@ class Message(BaseResource):
             "PATCH", 
             f"/channels/{self.channel_id}/messages/{self.id}", 
             data=message._prepare().to_dict(),
-            files=[fp.path for fp in message.attachments] if message.attachments else None)
+            files=message.attachments if message.attachments else None)
 
         return MessageModel.from_dict(data)
 
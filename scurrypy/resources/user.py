@@ -21,6 +21,19 @@ class User(BaseResource):
         data = await self._http.request('GET', f'/users/{self.id}')
 
         return UserModel.from_dict(data)
+    
+    async def get(self):
+        """Get this user from the entity cache, or fetch it if it isn't cached.
+
+        Returns:
+            (UserModel): the User object
+        """
+        data = self._cache.get_user(self.id) if self._cache else None
+
+        if data is None:
+            return await self.fetch()
+
+        return UserModel.from_dict(data)
 
     async def fetch_guild_member(self, guild_id: int):
         """Fetch this user's guild member data.
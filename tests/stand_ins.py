@@ -0,0 +1,108 @@
+"""Local stand-ins for Discord's REST API and gateway, served on free localhost ports."""
+
+import asyncio
+import time
+
+from aiohttp import web
+
+async def serve_http(handler):
+    """Serve every path with `handler`.
+
+    Args:
+        handler (callable): `async (request) -> web.Response`
+
+    Returns:
+        (tuple[web.AppRunner, str]): runner to clean up, and the base URL
+    """
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handler)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    site = web.TCPSite(runner, 'localhost', 0)
+    await site.start()
+
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://localhost:{port}"
+
+class RateServer:
+    """Fixed-window rate limits with Discord's headers: `limit` requests per `window` seconds per bucket.
+        Requests past the limit get a 429, like Discord.
+    """
+
+    def __init__(self, limit: int = 5, window: float = 1.0, latency: float = 0.1, bucket_of = None, bucket_hash = None):
+        """
+        Args:
+            limit (int, optional): requests per window. Defaults to 5.
+            window (float, optional): window length in seconds. Defaults to 1.0.
+            latency (float, optional): seconds before each response. Defaults to 0.1.
+            bucket_of (callable, optional): path -> bucket the server counts against. Defaults to the path.
+            bucket_hash (callable, optional): path -> `x-ratelimit-bucket` header. Defaults to `bucket_of`.
+        """
+        self.limit = limit
+        self.window = window
+        self.latency = latency
+        self.bucket_of = bucket_of or (lambda path: path)
+        self.bucket_hash = bucket_hash or self.bucket_of
+
+        self.windows: dict[str, tuple[float, int]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.ok = 0
+        self.too_many = 0
+
+    async def handle(self, request: web.Request):
+        bucket = self.bucket_of(request.path)
+
+        now = time.time()
+        start, used = self.windows.get(bucket, (now, 0))
+        if now - start >= self.window:
+            start, used = now, 0
+
+        used += 1
+        self.windows[bucket] = (start, used)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        reset = start + self.window
+        headers = {
+            'x-ratelimit-bucket': self.bucket_hash(request.path),
+            'x-ratelimit-limit': str(self.limit),
+            'x-ratelimit-remaining': str(max(0, self.limit - used)),
+            'x-ratelimit-reset': f"{reset:.3f}",
+            'x-ratelimit-reset-after': f"{max(0, reset - time.time()):.3f}"
+        }
+
+        if used > self.limit:
+            self.too_many += 1
+            retry_after = max(0, reset - time.time())
+            return web.json_response(
+                {'message': 'You are being rate limited.', 'retry_after': retry_after, 'global': False}, 
+                status=429, 
+                headers={**headers, 'x-ratelimit-scope': 'user', 'Retry-After': f"{retry_after:.3f}"}
+            )
+
+        self.ok += 1
+        return web.json_response({'ok': True}, headers=headers)
+
+async def serve_gateway(handler):
+    """Serve a websocket gateway with `handler`.
+
+    Args:
+        handler (callable): `async (websocket) -> None`
+
+    Returns:
+        (tuple[Server, str]): server to close, and its URL
+    """
+    import websockets
+
+    server = await websockets.serve(handler, 'localhost', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    return server, f"ws://localhost:{port}"
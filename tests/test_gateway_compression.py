@@ -0,0 +1,105 @@
+import asyncio
+import json
+import zlib
+
+from scurrypy.core.gateway import GatewayClient
+
+from stand_ins import serve_gateway
+
+HELLO = {'op': 10, 'd': {'heartbeat_interval': 60000}}
+
+GUILD_CREATE = {
+    'op': 0, 's': 1, 't': 'GUILD_CREATE', 
+    'd': {
+        'id': '1', 'name': 'guild', 
+        'channels': [{'id': str(100 + i), 'type': 0, 'name': f'channel-{i}'} for i in range(50)],
+        'members': [{'user': {'id': str(10**17 + i), 'username': f'user{i}'}, 'roles': []} for i in range(200)]
+    }
+}
+
+MESSAGE_CREATE = {'op': 0, 's': 2, 't': 'MESSAGE_CREATE', 'd': {'id': '5', 'channel_id': '100', 'content': 'hi'}}
+
+RECORDED = [HELLO, GUILD_CREATE, MESSAGE_CREATE]
+
+def record(payloads: list[dict], frame_size: int = 1000):
+    """Compress payloads into one zlib stream, split into frames like Discord may send.
+
+    Returns:
+        (list[bytes]): binary frames
+    """
+    z = zlib.compressobj()
+    frames = []
+
+    for payload in payloads:
+        data = z.compress(json.dumps(payload).encode()) + z.flush(zlib.Z_SYNC_FLUSH)
+        frames.extend(data[i:i + frame_size] for i in range(0, len(data), frame_size))
+
+    return frames
+
+def run_gateway(handler, check, compress: bool = True):
+    """Connect a shard to a stand-in gateway and run `check` against it."""
+
+    async def main():
+        server, url = await serve_gateway(handler)
+        shard = GatewayClient(url, 0, 1, compress=compress)
+        try:
+            await check(shard)
+        finally:
+            await shard.close_ws()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(main())
+
+def test_zlib_stream_frames_are_inflated():
+    frames = record(RECORDED)
+    paths = []
+
+    async def handler(ws):
+        paths.append(ws.request.path)
+        for frame in frames:
+            await ws.send(frame)
+        await ws.wait_closed()
+
+    async def check(shard):
+        await shard.connect_ws()
+        assert await shard.receive() == GUILD_CREATE
+        assert await shard.receive() == MESSAGE_CREATE
+
+    # the guild spans several frames
+    assert len(frames) > len(RECORDED)
+
+    run_gateway(handler, check)
+    assert 'compress=zlib-stream' in paths[0]
+
+def test_each_connection_gets_a_new_inflater():
+    async def handler(ws):
+        # every connection starts a fresh zlib stream
+        for frame in record(RECORDED):
+            await ws.send(frame)
+        await ws.wait_closed()
+
+    async def check(shard):
+        for _ in range(2):
+            await shard.connect_ws()
+            assert await shard.receive() == GUILD_CREATE
+            assert await shard.receive() == MESSAGE_CREATE
+            await shard.close_ws()
+
+    run_gateway(handler, check)
+
+def test_uncompressed_by_default():
+    paths = []
+
+    async def handler(ws):
+        paths.append(ws.request.path)
+        for payload in RECORDED:
+            await ws.send(json.dumps(payload))
+        await ws.wait_closed()
+
+    async def check(shard):
+        await shard.connect_ws()
+        assert await shard.receive() == GUILD_CREATE
+
+    run_gateway(handler, check, compress=False)
+    assert 'compress' not in paths[0]
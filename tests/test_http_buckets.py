@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from scurrypy.core.http import HTTPClient, route_key, major_key
+
+from stand_ins import RateServer, serve_http
+
+async def send_all(server: RateServer, endpoints: list[str]):
+    """POST to every endpoint at once through a fresh `HTTPClient`.
+
+    Returns:
+        (tuple[list, float, HTTPClient]): results, seconds taken, and the closed client
+    """
+    runner, url = await serve_http(server.handle)
+
+    http = HTTPClient()
+    http.BASE = url
+    await http.start('token')
+
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*[http.request('POST', endpoint, data={}) for endpoint in endpoints])
+        return results, time.perf_counter() - start, http
+    finally:
+        await http.close()
+        await runner.cleanup()
+
+def test_route_key_templates_minor_ids():
+    route = route_key('PUT', '/channels/1/messages/5/reactions/%F0%9F%91%8D/@me')
+
+    assert route == 'PUT /channels/1/messages/{id}/reactions/{emoji}/@me'
+    assert route == route_key('PUT', '/channels/1/messages/6/reactions/x/@me')
+    assert route != route_key('PUT', '/channels/2/messages/6/reactions/x/@me')
+
+def test_major_key():
+    assert major_key(route_key('POST', '/channels/1/messages')) == '1'
+    assert major_key(route_key('GET', '/guilds/7/members')) == '7'
+    assert major_key(route_key('POST', '/webhooks/9/tok/messages/3')) == '9/tok'
+
+def test_bucket_runs_requests_concurrently():
+    # 5 per second at 0.1s each: one at a time would take 2s for 20
+    server = RateServer(limit=5, window=1.0, latency=0.1)
+
+    results, elapsed, _ = asyncio.run(send_all(server, ['/channels/1/messages'] * 20))
+
+    assert all(results)
+    assert server.max_in_flight > 1
+    assert elapsed < 4.5
+
+def test_bucket_is_never_exceeded():
+    server = RateServer(limit=5, window=1.0, latency=0.05)
+
+    results, _, _ = asyncio.run(send_all(server, ['/channels/1/messages'] * 20))
+
+    assert all(results)
+    assert server.too_many == 0
+    assert server.max_in_flight <= server.limit
+
+def test_major_parameters_get_separate_buckets():
+    # Discord returns one bucket hash for every channel, but each channel has its own limit
+    server = RateServer(
+        limit=2, window=1.0, latency=0.02, 
+        bucket_of=lambda path: path.split('/')[2], 
+        bucket_hash=lambda path: 'abc'
+    )
+    endpoints = [f'/channels/{channel}/messages' for channel in (1, 2) for _ in range(6)]
+
+    results, elapsed, http = asyncio.run(send_all(server, endpoints))
+
+    assert all(results)
+    assert server.too_many == 0
+
+    # 6 per channel at 2/s is 3 windows; sharing one bucket would take 6
+    assert elapsed < 3.5
+    assert {'abc:1', 'abc:2'} <= set(http.buckets)
+
+def test_429_is_waited_out_and_retried():
+    # another process already spent this window
+    server = RateServer(limit=5, window=1.0, latency=0.02)
+    server.windows['/channels/1/messages'] = (time.time(), 5)
+
+    results, elapsed, http = asyncio.run(send_all(server, ['/channels/1/messages'] * 5))
+
+    assert all(results)
+    assert server.too_many >= 1
+    assert sum(http.metrics()['retries'].values()) == server.too_many
+    assert elapsed >= 0.5
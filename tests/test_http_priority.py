@@ -0,0 +1,34 @@
+import time
+
+from scurrypy.core.http import HTTPClient, RequestItem, RequestPriorities, DISCORD_EPOCH, request_priority
+
+def snowflake(seconds_ago: float):
+    """Snowflake created `seconds_ago` seconds ago."""
+    return (int((time.time() - seconds_ago) * 1000) - DISCORD_EPOCH) << 22
+
+def callback(endpoint: str):
+    return RequestItem('POST', endpoint, priority=RequestPriorities.INTERACTION)
+
+def test_request_priority():
+    assert request_priority('/interactions/1/tok/callback') == RequestPriorities.INTERACTION
+    assert request_priority('/webhooks/1/tok/messages/@original') == RequestPriorities.FOLLOWUP
+    assert request_priority('/webhooks/1') == RequestPriorities.DEFAULT
+    assert request_priority('/channels/1/messages') == RequestPriorities.DEFAULT
+
+def test_late_callback_is_counted():
+    http = HTTPClient()
+
+    http._check_deadline(callback(f'/interactions/{snowflake(1)}/tok/callback'))
+    assert http.missed_deadlines == 0
+
+    http._check_deadline(callback(f'/interactions/{snowflake(10)}/tok/callback'))
+    assert http.missed_deadlines == 1
+
+def test_deadline_ignores_other_endpoints():
+    # INTERACTION priority set by hand on endpoints that carry no interaction ID
+    http = HTTPClient()
+
+    for endpoint in ('/interactions', '/', '/channels/1/messages', '/interactions/abc/tok/callback'):
+        http._check_deadline(callback(endpoint))
+
+    assert http.missed_deadlines == 0